@@ -74,6 +74,11 @@ a = Analysis(
         # CLI
         "kabolai.cli",
         "kabolai.cli.main",
+        "kabolai.cli._run",
+        "kabolai.cli._gui",
+        "kabolai.cli._setup",
+        "kabolai.cli._test",
+        "kabolai.cli._checks",
         # Assistant
         "kabolai.assistant",
         # Libraries
@@ -1,17 +1,39 @@
 """Download VOSK models for the selected hardware profile."""
 
 import argparse
+import hashlib
+import json
 import os
 import shutil
-import sys
-import urllib.request
+import tarfile
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import urllib3
+
 # Project root
 ROOT = Path(__file__).parent.parent
 MODELS_DIR = ROOT / "models" / "vosk"
 
+# Large archives are fetched as this many parallel byte-range stripes
+STRIPE_COUNT = 4
+STRIPE_MIN_SIZE = 32 << 20
+
+# Shared connection pool — keep-alive connections are reused across models
+_http = urllib3.PoolManager(num_pools=4, maxsize=2 * STRIPE_COUNT)
+
+# Bytes read from the socket per write to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Downloaded archives are kept here so re-installs skip the download
+CACHE_ROOT = Path.home() / ".cache" / "kabolai" / "vosk"
+
+# A model entry may also carry a "url_zst" pointing at a .tar.zst repack of
+# the same model. When set and the optional zstandard package is installed,
+# the archive is decompressed straight off the socket into the model
+# directory; otherwise the upstream .zip is used.
 VOSK_MODELS = {
     "cpu": {
         "en": {
@@ -52,51 +74,383 @@ VOSK_MODELS = {
 }
 
 
-def download_model(url: str, target_dir: Path, dir_name: str, size_mb: int):
-    """Download and extract a VOSK model."""
+def download_model(url: str, target_dir: Path, dir_name: str, size_mb: int,
+                   url_zst: str = None, label: str = None):
+    """Download and extract a VOSK model, reusing the local archive cache.
+
+    Status lines are prefixed with label (default: the target directory
+    name), since several models may download at once.
+    """
+    label = (label or target_dir.name).upper()
     target_dir.mkdir(parents=True, exist_ok=True)
 
     # Check if already downloaded
     if any(target_dir.iterdir()):
-        print(f"  Model already exists at {target_dir}, skipping.")
+        _say(label, f"Model already exists at {target_dir}, skipping.")
         return
 
-    zip_path = target_dir.parent / f"{dir_name}.zip"
+    if url_zst and _zstd_available():
+        _say(label, f"Streaming {url_zst} (~{size_mb}MB)...")
+        try:
+            _install(target_dir, lambda staging: _stream_zst(url_zst, staging, dir_name))
+            _say(label, "Done!")
+            return
+        except Exception as e:
+            _say(label, f"Streaming failed ({e}), falling back to zip.")
+
+    zip_path = _cache_path(url)
+    if _cache_valid(zip_path, dir_name):
+        _say(label, f"Using cached archive {zip_path}")
+    else:
+        _say(label, f"Downloading {url} (~{size_mb}MB)...")
+        try:
+            _download_to_cache(url, zip_path, dir_name, _Progress(label))
+        except Exception as e:
+            _say(label, f"Download failed: {e}")
+            return
 
-    print(f"  Downloading {url} (~{size_mb}MB)...")
+    _say(label, f"Extracting to {target_dir}...")
     try:
-        urllib.request.urlretrieve(url, str(zip_path), reporthook=_progress)
-        print()
+        _install(target_dir, lambda staging: _extract(zip_path, staging, dir_name))
+        _say(label, "Done!")
     except Exception as e:
-        print(f"\n  Download failed: {e}")
+        _say(label, f"Extraction failed: {e}")
+
+
+def _install(target_dir: Path, fill):
+    """Populate a staging directory with fill() and swap it into place.
+
+    An interrupted run never leaves a half-populated model directory behind.
+    """
+    staging = target_dir.parent / f".{target_dir.name}.partial"
+    shutil.rmtree(staging, ignore_errors=True)
+    try:
+        staging.mkdir(parents=True)
+        fill(staging)
+        target_dir.rmdir()
+        os.replace(staging, target_dir)
+    except Exception:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+
+def _zstd_available() -> bool:
+    try:
+        import zstandard  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _cache_path(url: str) -> Path:
+    """Cache location for a model archive, keyed by its URL."""
+    return CACHE_ROOT / (hashlib.sha256(url.encode()).hexdigest() + ".zip")
+
+
+def _hash_algo() -> str:
+    """Local integrity hash: xxh3 if xxhash is installed, else sha256."""
+    try:
+        import xxhash  # noqa: F401
+        return "xxh3"
+    except ImportError:
+        return "sha256"
+
+
+def _fingerprint(path: Path, algo: str) -> str:
+    if algo == "xxh3":
+        import xxhash
+        h = xxhash.xxh3_64()
+    else:
+        h = hashlib.new(algo)
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(DOWNLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _cache_valid(zip_path: Path, dir_name: str) -> bool:
+    """True if the cached archive matches its manifest.
+
+    A missing, truncated or corrupted archive is treated as a miss.
+    """
+    meta_path = zip_path.with_suffix(".meta")
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if meta.get("dir_name") != dir_name:
+            return False
+        if zip_path.stat().st_size != meta.get("size"):
+            return False
+        algo = _hash_algo()
+        if algo not in meta:
+            algo = "sha256"
+        if algo not in meta:
+            return False
+        return _fingerprint(zip_path, algo) == meta[algo]
+    except (OSError, ValueError):
+        return False
+
+
+def _download_to_cache(url: str, zip_path: Path, dir_name: str, progress):
+    """Download into the cache and record a manifest for later validation.
+
+    An interrupted transfer keeps its ``.part`` file; the next run resumes
+    it with a Range request guarded by If-Range, so a file that changed
+    upstream is fetched again from the start.
+    """
+    zip_path.parent.mkdir(parents=True, exist_ok=True)
+    part = zip_path.with_suffix(".zip.part")
+    validator_path = zip_path.with_suffix(".part.json")
+    _fetch(url, part, validator_path, progress)
+    os.replace(part, zip_path)
+    validator_path.unlink(missing_ok=True)
+
+    algo = _hash_algo()
+    meta = {
+        "url": url,
+        "dir_name": dir_name,
+        "size": zip_path.stat().st_size,
+        algo: _fingerprint(zip_path, algo),
+    }
+    zip_path.with_suffix(".meta").write_text(json.dumps(meta), encoding="utf-8")
+
+
+def _extract(zip_path: Path, target_dir: Path, dir_name: str):
+    """Extract a model archive straight into target_dir.
+
+    The archive's top-level ``dir_name/`` folder is stripped so no
+    rename step is needed afterwards. Files are inflated in parallel
+    (zlib releases the GIL); each worker thread opens its own ZipFile
+    because a single handle is not safe for concurrent reads.
+    """
+    root = target_dir.resolve()
+    jobs = []
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        for info in zf.infolist():
+            dest = _member_dest(root, info.filename, dir_name)
+            if dest is None:
+                continue
+            if info.is_dir():
+                dest.mkdir(parents=True, exist_ok=True)
+                continue
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            jobs.append((info, dest))
+
+    local = threading.local()
+    handles = []
+
+    def extract_one(job):
+        info, dest = job
+        zf = getattr(local, "zf", None)
+        if zf is None:
+            zf = local.zf = zipfile.ZipFile(zip_path, "r")
+            handles.append(zf)
+        with zf.open(info) as src, open(dest, "wb") as dst:
+            shutil.copyfileobj(src, dst, length=DOWNLOAD_CHUNK_SIZE)
+
+    try:
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+            list(pool.map(extract_one, jobs))
+    finally:
+        for zf in handles:
+            zf.close()
+
+
+def _member_dest(root: Path, member_name: str, dir_name: str):
+    """Destination for an archive member, or None for the top-level folder.
+
+    The leading ``dir_name/`` is stripped; members escaping root are rejected.
+    """
+    name = member_name
+    if name.startswith("./"):
+        name = name[2:]
+    prefix = f"{dir_name}/"
+    if name.startswith(prefix):
+        name = name[len(prefix):]
+    name = name.rstrip("/")
+    if not name or name == dir_name:
+        return None
+    dest = (root / name).resolve()
+    if root not in dest.parents:
+        raise OSError(f"Unsafe path in archive: {member_name}")
+    return dest
+
+
+def _stream_zst(url: str, target_dir: Path, dir_name: str):
+    """Decompress a .tar.zst model straight from the network into target_dir.
+
+    Single pass: no archive is written to disk.
+    """
+    import zstandard
+
+    root = target_dir.resolve()
+    resp = _http.request("GET", url, preload_content=False)
+    try:
+        if resp.status != 200:
+            raise OSError(f"HTTP {resp.status}")
+        dctx = zstandard.ZstdDecompressor()
+        with dctx.stream_reader(resp) as reader, \
+                tarfile.open(fileobj=reader, mode="r|") as tf:
+            for member in tf:
+                dest = _member_dest(root, member.name, dir_name)
+                if dest is None:
+                    continue
+                if member.isdir():
+                    dest.mkdir(parents=True, exist_ok=True)
+                elif member.isfile():
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    with tf.extractfile(member) as src, open(dest, "wb") as dst:
+                        shutil.copyfileobj(src, dst, length=DOWNLOAD_CHUNK_SIZE)
+    finally:
+        resp.release_conn()
+
+
+def _load_validator(validator_path: Path, url: str) -> str:
+    """ETag or Last-Modified recorded for a partial download of url."""
+    try:
+        data = json.loads(validator_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return ""
+    return data.get("validator", "") if data.get("url") == url else ""
+
+
+class _NoRangeSupport(Exception):
+    """The server answered a Range request with the whole file."""
+
+
+def _fetch_striped(url: str, part: Path, progress) -> bool:
+    """Download url as parallel Range stripes into a preallocated part file.
+
+    Returns False, leaving nothing behind, when the file is too small to
+    be worth splitting or the server does not honour byte ranges.
+    """
+    head = _http.request("HEAD", url)
+    size = int(head.headers.get("Content-Length", 0))
+    if (head.status != 200 or size < STRIPE_MIN_SIZE
+            or head.headers.get("Accept-Ranges") != "bytes"):
+        return False
+    etag = head.headers.get("ETag", "")
+
+    stripe = -(-size // STRIPE_COUNT)
+    ranges = [(start, min(start + stripe, size)) for start in range(0, size, stripe)]
+    with open(part, "wb") as f:
+        f.truncate(size)
+
+    lock = threading.Lock()
+    downloaded = [0]
+
+    def fetch_range(bounds):
+        start, end = bounds
+        headers = {"Range": f"bytes={start}-{end - 1}"}
+        if etag and not etag.startswith("W/"):
+            headers["If-Range"] = etag
+        resp = _http.request("GET", url, headers=headers, preload_content=False)
+        try:
+            if resp.status != 206:
+                raise _NoRangeSupport()
+            written = 0
+            with open(part, "r+b") as f:
+                f.seek(start)
+                for chunk in resp.stream(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    written += len(chunk)
+                    with lock:
+                        downloaded[0] += len(chunk)
+                        progress(downloaded[0], size)
+            if written != end - start:
+                raise OSError(f"Short read for bytes {start}-{end - 1}")
+        finally:
+            resp.release_conn()
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            list(pool.map(fetch_range, ranges))
+    except _NoRangeSupport:
+        part.unlink(missing_ok=True)
+        return False
+    except Exception:
+        # A preallocated file cannot be resumed from its size
+        part.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def _fetch(url: str, part: Path, validator_path: Path, progress):
+    """Stream a URL into part over the shared pool, resuming if possible."""
+    offset = part.stat().st_size if part.exists() else 0
+    if not offset and _fetch_striped(url, part, progress):
         return
+    validator = _load_validator(validator_path, url) if offset else ""
+    headers = {"Range": f"bytes={offset}-", "If-Range": validator} if validator else {}
 
-    print(f"  Extracting to {target_dir}...")
+    resp = _http.request("GET", url, headers=headers, preload_content=False)
     try:
-        with zipfile.ZipFile(str(zip_path), "r") as zf:
-            zf.extractall(str(target_dir.parent))
-
-        # Move contents from extracted dir to target
-        extracted = target_dir.parent / dir_name
-        if extracted.exists() and extracted != target_dir:
-            if target_dir.exists():
-                shutil.rmtree(target_dir)
-            extracted.rename(target_dir)
-
-        zip_path.unlink(missing_ok=True)
-        print(f"  Done!")
-    except Exception as e:
-        print(f"  Extraction failed: {e}")
-        zip_path.unlink(missing_ok=True)
+        if resp.status == 416:
+            # The partial file is stale or already complete; start over
+            part.unlink()
+            validator_path.unlink(missing_ok=True)
+            restart = True
+        elif resp.status in (200, 206):
+            restart = False
+            if resp.status == 200:
+                offset = 0
+            # Weak ETags are not allowed in If-Range
+            etag = resp.headers.get("ETag", "")
+            new_validator = "" if etag.startswith("W/") else etag
+            new_validator = new_validator or resp.headers.get("Last-Modified", "")
+            if new_validator:
+                validator_path.write_text(
+                    json.dumps({"url": url, "validator": new_validator}),
+                    encoding="utf-8",
+                )
+            elif resp.status == 200:
+                validator_path.unlink(missing_ok=True)
+
+            total = offset + int(resp.headers.get("Content-Length", 0))
+            downloaded = offset
+            with open(part, "ab" if resp.status == 206 else "wb") as f:
+                for chunk in resp.stream(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    downloaded += len(chunk)
+                    progress(downloaded, total)
+        else:
+            raise OSError(f"HTTP {resp.status}")
+    finally:
+        resp.release_conn()
 
+    if restart:
+        _fetch(url, part, validator_path, progress)
 
-def _progress(block_num, block_size, total_size):
-    """Download progress callback."""
-    downloaded = block_num * block_size
-    if total_size > 0:
+
+# Models download concurrently, so progress is printed as whole lines
+# (one per PROGRESS_STEP percent) rather than a redrawn bar
+PROGRESS_STEP = 10
+_print_lock = threading.Lock()
+
+
+def _say(label: str, message: str):
+    """Print one status line for a model download."""
+    with _print_lock:
+        print(f"  [{label}] {message}", flush=True)
+
+
+class _Progress:
+    """Progress callback for a single download."""
+
+    def __init__(self, label: str):
+        self.label = label
+        self._next = PROGRESS_STEP
+
+    def __call__(self, downloaded, total_size):
+        if total_size <= 0:
+            return
         percent = min(100, downloaded * 100 // total_size)
-        bar = "#" * (percent // 5) + "-" * (20 - percent // 5)
-        print(f"\r  [{bar}] {percent}%", end="", flush=True)
+        if percent < self._next:
+            return
+        self._next = percent - percent % PROGRESS_STEP + PROGRESS_STEP
+        _say(self.label, f"{percent}%")
 
 
 def main():
@@ -113,10 +467,21 @@ def main():
     print(f"Downloading VOSK models for profile: {args.profile}\n")
 
     for lang, info in models.items():
-        target = MODELS_DIR / lang
         print(f"[{lang.upper()}] {info['dir_name']} (~{info['size_mb']}MB)")
-        download_model(info["url"], target, info["dir_name"], info["size_mb"])
-        print()
+
+    # Download all languages concurrently; extraction of one model
+    # overlaps with the network transfer of the other.
+    with ThreadPoolExecutor(max_workers=len(models)) as pool:
+        futures = [
+            pool.submit(
+                download_model, info["url"], MODELS_DIR / lang,
+                info["dir_name"], info["size_mb"], info.get("url_zst"), lang,
+            )
+            for lang, info in models.items()
+        ]
+        for future in futures:
+            future.result()
+    print()
 
     print("All models downloaded. You can now run: kabolai run")
 
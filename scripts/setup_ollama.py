@@ -1,10 +1,21 @@
 """Setup Ollama and pull the correct model for the selected profile."""
 
 import argparse
+import json
 import subprocess
 import sys
 
-import requests
+import urllib3
+
+OLLAMA_TAGS_URL = "http://localhost:11434/api/tags"
+
+# One pooled keep-alive connection is reused by every Ollama call below
+_http = urllib3.PoolManager(
+    num_pools=1,
+    maxsize=2,
+    timeout=urllib3.Timeout(connect=2, read=5),
+    retries=False,
+)
 
 PROFILE_MODELS = {
     "cpu": "qwen2.5:1.5b",
@@ -16,8 +27,7 @@ PROFILE_MODELS = {
 def check_ollama():
     """Check if Ollama is running."""
     try:
-        r = requests.get("http://localhost:11434/api/tags", timeout=5)
-        return r.status_code == 200
+        return _http.request("GET", OLLAMA_TAGS_URL).status == 200
     except Exception:
         return False
 
@@ -25,8 +35,8 @@ def check_ollama():
 def list_models():
     """List available Ollama models."""
     try:
-        r = requests.get("http://localhost:11434/api/tags", timeout=5)
-        return [m["name"] for m in r.json().get("models", [])]
+        r = _http.request("GET", OLLAMA_TAGS_URL)
+        return [m["name"] for m in json.loads(r.data).get("models", [])]
     except Exception:
         return []
 
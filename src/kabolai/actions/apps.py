@@ -1,9 +1,12 @@
 """Application management actions."""
 
+import bisect
 import logging
+import os
 import subprocess
-
-import psutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 from kabolai.actions.base import ActionResult
 from kabolai.actions.registry import registry
@@ -11,7 +14,7 @@ from kabolai.actions.registry import registry
 logger = logging.getLogger(__name__)
 
 # App name -> executable mapping (English + Ukrainian aliases)
-APP_MAP = {
+_RAW_APP_MAP = {
     # English
     "notepad": "notepad.exe",
     "calculator": "calc.exe",
@@ -40,6 +43,89 @@ APP_MAP = {
     "браузер": "msedge.exe",
 }
 
+# Lookup keys are normalized once at import; callers only lowercase the query
+APP_MAP = {k.lower(): v for k, v in _RAW_APP_MAP.items()}
+
+# Plain executables from APP_MAP can be spawned directly, without cmd.exe
+_KNOWN_EXES = frozenset(v for v in APP_MAP.values() if v.endswith(".exe"))
+
+# Sorted keys for prefix lookups ("file expl" -> "file explorer")
+_APP_KEYS = sorted(APP_MAP)
+
+
+def _match_app_prefix(prefix: str) -> list[str]:
+    """Return APP_MAP keys starting with prefix (already lowercased)."""
+    i = bisect.bisect_left(_APP_KEYS, prefix)
+    matches = []
+    while i < len(_APP_KEYS) and _APP_KEYS[i].startswith(prefix):
+        matches.append(_APP_KEYS[i])
+        i += 1
+    return matches
+
+
+# Process table snapshot shared by back-to-back commands
+PROC_CACHE_TTL = 1.0
+_proc_cache = {"ts": 0.0, "procs": [], "index": {}, "index_src": None}
+
+
+def _get_procs(ttl: float = PROC_CACHE_TTL) -> list[tuple[Any, str, str]]:
+    """Return a cached ``(process, name, name_lower)`` snapshot of running processes.
+
+    The psutil.Process objects are kept rather than bare pids: psutil
+    checks their creation time before signalling, so a pid reused since
+    the snapshot is never terminated by mistake.
+    """
+    now = time.monotonic()
+    if now - _proc_cache["ts"] < ttl:
+        return _proc_cache["procs"]
+
+    import psutil
+
+    procs = []
+    for proc in psutil.process_iter(["name"]):
+        name = proc.info["name"]
+        if name:
+            procs.append((proc, name, name.lower()))
+    _proc_cache["procs"] = procs
+    _proc_cache["ts"] = now
+    return procs
+
+
+def _get_proc_index() -> dict[str, list[tuple[Any, str]]]:
+    """Return ``{basename: [(process, name), ...]}`` over the current snapshot.
+
+    Keys are lowercased process names without ``.exe``. The index is
+    rebuilt only when _get_procs() hands out a new snapshot.
+    """
+    procs = _get_procs()
+    if _proc_cache["index_src"] is not procs:
+        index = {}
+        for proc, name, name_lower in procs:
+            index.setdefault(name_lower.removesuffix(".exe"), []).append((proc, name))
+        _proc_cache["index"] = index
+        _proc_cache["index_src"] = procs
+    return _proc_cache["index"]
+
+
+# Background Windows host processes hidden from list_running_apps
+_EXCLUDED_PROC_PREFIXES = ("svchost", "conhost", "RuntimeBroker", "dllhost")
+
+
+def _invalidate_procs():
+    """Force the next _get_procs() call to rescan the process table."""
+    _proc_cache["ts"] = 0.0
+
+
+def _safe_terminate(proc) -> bool:
+    """Terminate a psutil.Process; False if it is gone (or its pid reused) or not ours."""
+    import psutil
+
+    try:
+        proc.terminate()
+        return True
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return False
+
 
 @registry.register(
     name="open_app",
@@ -54,14 +140,23 @@ APP_MAP = {
 )
 def open_app(app_name: str) -> ActionResult:
     """Open an application on Windows."""
-    exe = APP_MAP.get(app_name.lower())
+    app_lower = app_name.lower()
+    exe = APP_MAP.get(app_lower)
+    if exe is None:
+        # Accept a truncated ASR result when it names exactly one app
+        matches = _match_app_prefix(app_lower)
+        if len(matches) == 1:
+            exe = APP_MAP[matches[0]]
     target = exe or app_name
 
     try:
         if target.startswith("ms-"):
-            # Windows URI scheme (settings, store, etc.)
-            subprocess.Popen(["start", target], shell=True)
+            # Windows URI scheme (settings, store, etc.) via ShellExecute
+            os.startfile(target)
+        elif target in _KNOWN_EXES:
+            subprocess.Popen([target])
         else:
+            # Arbitrary names (and .cmd shims like "code") need the shell
             subprocess.Popen(target, shell=True)
         return ActionResult(
             success=True,
@@ -91,18 +186,23 @@ def open_app(app_name: str) -> ActionResult:
 def close_app(app_name: str) -> ActionResult:
     """Close an application by name."""
     app_lower = app_name.lower()
-    killed = []
+    victims = _get_proc_index().get(app_lower.removesuffix(".exe"))
+    if not victims:
+        # No exact name match — fall back to a substring scan
+        victims = [
+            (proc, name) for proc, name, name_lower in _get_procs()
+            if app_lower in name_lower
+        ]
 
-    for proc in psutil.process_iter(["name", "pid"]):
-        try:
-            proc_name = proc.info["name"].lower()
-            if app_lower in proc_name:
-                proc.terminate()
-                killed.append(proc.info["name"])
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            continue
+    killed = []
+    if victims:
+        # Apps like browsers run many helper processes; terminate in parallel
+        with ThreadPoolExecutor(max_workers=min(8, len(victims))) as pool:
+            results = pool.map(_safe_terminate, [proc for proc, _ in victims])
+            killed = [name for (_, name), ok in zip(victims, results) if ok]
 
     if killed:
+        _invalidate_procs()
         return ActionResult(
             success=True,
             message=f"Closed: {', '.join(killed)}",
@@ -125,14 +225,11 @@ def close_app(app_name: str) -> ActionResult:
 )
 def list_running_apps() -> ActionResult:
     """List visible running applications."""
-    apps = set()
-    for proc in psutil.process_iter(["name"]):
-        try:
-            name = proc.info["name"]
-            if name and not name.startswith("svchost") and name.endswith(".exe"):
-                apps.add(name.replace(".exe", ""))
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            continue
+    apps = {
+        name.removesuffix(".exe")
+        for _, name, _ in _get_procs()
+        if name.endswith(".exe") and not name.startswith(_EXCLUDED_PROC_PREFIXES)
+    }
 
     top_apps = sorted(apps)[:15]
     app_list = ", ".join(top_apps)
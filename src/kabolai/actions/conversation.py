@@ -62,9 +62,11 @@ def switch_language(language: str = None) -> ActionResult:
 def list_commands() -> ActionResult:
     """List available commands."""
     actions = registry.list_actions()
-    by_category = {}
-    for a in actions:
-        by_category.setdefault(a.category, []).append(a.name)
+    by_category = {
+        cat: [a.name for a in metas]
+        for cat, metas in registry.actions_by_category().items()
+        if metas
+    }
 
     lines_en = []
     lines_uk = []
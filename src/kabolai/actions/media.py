@@ -14,14 +14,52 @@ VK_VOLUME_DOWN = 0xAE
 VK_VOLUME_UP = 0xAF
 
 KEYEVENTF_KEYUP = 0x0002
+INPUT_KEYBOARD = 1
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.c_int32),
+        ("dy", ctypes.c_int32),
+        ("mouseData", ctypes.c_uint32),
+        ("dwFlags", ctypes.c_uint32),
+        ("time", ctypes.c_uint32),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", ctypes.c_uint16),
+        ("wScan", ctypes.c_uint16),
+        ("dwFlags", ctypes.c_uint32),
+        ("time", ctypes.c_uint32),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    # MOUSEINPUT is the largest member; it must be present so that
+    # sizeof(INPUT) matches what SendInput expects.
+    _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT)]
+
+
+class INPUT(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_uint32), ("u", _INPUTUNION)]
 
 
 def _press_volume_key(vk_code: int, times: int = 1):
-    """Send volume key presses via Windows API."""
+    """Send volume key presses via Windows API.
+
+    All down/up events are submitted in a single SendInput call.
+    """
     user32 = ctypes.windll.user32
-    for _ in range(times):
-        user32.keybd_event(vk_code, 0, 0, 0)
-        user32.keybd_event(vk_code, 0, KEYEVENTF_KEYUP, 0)
+    events = (INPUT * (2 * times))()
+    for i, event in enumerate(events):
+        event.type = INPUT_KEYBOARD
+        event.u.ki.wVk = vk_code
+        event.u.ki.dwFlags = KEYEVENTF_KEYUP if i % 2 else 0
+    user32.SendInput(len(events), events, ctypes.sizeof(INPUT))
 
 
 @registry.register(
@@ -21,6 +21,41 @@ class ActionMeta:
     parameters: list[dict] = field(default_factory=list)
     handler: Callable = field(default=None)
     aliases: list[str] = field(default_factory=list)
+    # Pre-rendered "name: type (required)" list used by the LLM schema
+    params_str: str = field(init=False, default="")
+    # Handler shim built once per action, see _compile_call()
+    fast_call: Callable = field(init=False, default=None, repr=False)
+
+    def __post_init__(self):
+        self.params_str = ", ".join(
+            f"{p['name']}: {p['type']}{' (required)' if p.get('required') else ''}"
+            for p in self.parameters
+        )
+        if self.handler is not None:
+            self.fast_call = _compile_call(self.handler, self.parameters)
+
+
+def _compile_call(handler: Callable, parameters: list[dict]) -> Callable:
+    """Build a params-dict -> handler call shim for one action.
+
+    Required parameters are checked up front so a missing one fails with a
+    clear message instead of relying on Python's argument binding.
+    Parameterless calls skip keyword unpacking entirely.
+    """
+    required = tuple(p["name"] for p in parameters if p.get("required"))
+
+    def fast_call(params: dict):
+        if required:
+            missing = [n for n in required if n not in params]
+            if missing:
+                raise TypeError(
+                    f"missing required parameter(s): {', '.join(missing)}"
+                )
+        if not params:
+            return handler()
+        return handler(**params)
+
+    return fast_call
 
 
 class ActionRegistry:
@@ -32,6 +67,10 @@ class ActionRegistry:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._actions = {}
+            cls._instance._schema_cache = {}
+            # Canonical actions (no aliases), overall and per category
+            cls._instance._unique = []
+            cls._instance._by_category = {}
         return cls._instance
 
     def register(
@@ -54,9 +93,17 @@ class ActionRegistry:
                 handler=func,
                 aliases=aliases or [],
             )
+            previous = self._actions.get(name)
+            if previous is not None and previous.name == name:
+                self._unique.remove(previous)
+                self._by_category[previous.category].remove(previous)
+            self._unique.append(meta)
+            self._by_category.setdefault(category, []).append(meta)
+
             self._actions[name] = meta
             for alias in meta.aliases:
                 self._actions[alias] = meta
+            self._schema_cache.clear()
             return func
         return decorator
 
@@ -74,7 +121,7 @@ class ActionRegistry:
                 speak_text_uk=f"Я не знаю, як це зробити.",
             )
         try:
-            return meta.handler(**params)
+            return meta.fast_call(params)
         except TypeError as e:
             logger.error(f"Action '{name}' parameter error: {e}")
             return ActionResult(
@@ -93,28 +140,34 @@ class ActionRegistry:
             )
 
     def list_actions(self, category: Optional[str] = None) -> list[ActionMeta]:
-        """List unique actions, optionally filtered by category."""
-        seen = set()
-        result = []
-        for meta in self._actions.values():
-            if meta.name not in seen:
-                if category is None or meta.category == category:
-                    result.append(meta)
-                    seen.add(meta.name)
-        return result
+        """List unique actions, optionally filtered by category.
+
+        Returns a copy of the cached index, so callers may sort or extend it.
+        """
+        if category is None:
+            return list(self._unique)
+        return list(self._by_category.get(category, ()))
+
+    def actions_by_category(self) -> dict[str, list[ActionMeta]]:
+        """Unique actions grouped by category, in registration order."""
+        return {cat: list(metas) for cat, metas in self._by_category.items()}
 
     def get_schema_for_llm(self, language: str = "en") -> str:
-        """Generate action schema text for the LLM system prompt."""
+        """Generate action schema text for the LLM system prompt.
+
+        The result is cached per language until the next registration.
+        """
+        schema = self._schema_cache.get(language)
+        if schema is not None:
+            return schema
+
         lines = []
         for meta in self.list_actions():
             desc = meta.description_en if language == "en" else meta.description_uk
-            params_parts = []
-            for p in meta.parameters:
-                req = " (required)" if p.get("required") else ""
-                params_parts.append(f"{p['name']}: {p['type']}{req}")
-            params_str = ", ".join(params_parts)
-            lines.append(f"- {meta.name}({params_str}): {desc}")
-        return "\n".join(lines)
+            lines.append(f"- {meta.name}({meta.params_str}): {desc}")
+        schema = "\n".join(lines)
+        self._schema_cache[language] = schema
+        return schema
 
 
 # Module-level singleton
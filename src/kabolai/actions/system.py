@@ -4,14 +4,45 @@ import datetime
 import logging
 import platform
 import socket
-
-import psutil
+import threading
 
 from kabolai.actions.base import ActionResult
 from kabolai.actions.registry import registry
 
 logger = logging.getLogger(__name__)
 
+# CPU usage is sampled in the background so get_system_info doesn't block
+CPU_SAMPLE_INTERVAL = 1.0
+_cpu_percent = [None]
+_cpu_sampler_lock = threading.Lock()
+_cpu_sampler_thread = None
+
+
+def _cpu_sampler():
+    """Keep _cpu_percent updated with the latest system-wide CPU usage."""
+    import psutil
+
+    while True:
+        _cpu_percent[0] = psutil.cpu_percent(interval=CPU_SAMPLE_INTERVAL)
+
+
+def _read_cpu_percent() -> float:
+    """Latest sampled CPU usage; starts the sampler on first use."""
+    global _cpu_sampler_thread
+    with _cpu_sampler_lock:
+        if _cpu_sampler_thread is None:
+            _cpu_sampler_thread = threading.Thread(
+                target=_cpu_sampler, daemon=True, name="cpu-sampler"
+            )
+            _cpu_sampler_thread.start()
+
+    value = _cpu_percent[0]
+    if value is None:
+        # No sample yet (first request) — measure once synchronously
+        import psutil
+        value = psutil.cpu_percent(interval=0.5)
+    return value
+
 
 @registry.register(
     name="get_time",
@@ -61,7 +92,9 @@ def get_date() -> ActionResult:
 )
 def get_system_info() -> ActionResult:
     """Report system status."""
-    cpu_percent = psutil.cpu_percent(interval=0.5)
+    import psutil
+
+    cpu_percent = _read_cpu_percent()
     memory = psutil.virtual_memory()
     disk = psutil.disk_usage("/")
 
@@ -104,6 +137,39 @@ def get_system_info() -> ActionResult:
     )
 
 
+# Adapter name prefixes used by hypervisors, containers and VPN tunnels
+_VIRTUAL_ADAPTERS = (
+    "vethernet", "virtualbox", "vmware", "vmnet", "vboxnet", "virbr",
+    "docker", "br-", "veth", "tun", "tap", "wsl", "zt", "tailscale",
+)
+
+
+def _first_up_ipv4():
+    """IPv4 address of the first physical-looking adapter that is up.
+
+    Skips down adapters, loopback and link-local addresses; virtual
+    adapters are used only when nothing else has an address.
+    """
+    import psutil
+
+    fallback = None
+    try:
+        stats = psutil.net_if_stats()
+        for name, addrs in psutil.net_if_addrs().items():
+            if name not in stats or not stats[name].isup:
+                continue
+            for addr in addrs:
+                if (addr.family != socket.AF_INET
+                        or addr.address.startswith(("127.", "169.254."))):
+                    continue
+                if not name.lower().startswith(_VIRTUAL_ADAPTERS):
+                    return addr.address
+                fallback = fallback or addr.address
+    except Exception:
+        pass
+    return fallback
+
+
 @registry.register(
     name="get_ip_address",
     category="system",
@@ -112,13 +178,7 @@ def get_system_info() -> ActionResult:
 )
 def get_ip_address() -> ActionResult:
     """Report local IP address."""
-    try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        local_ip = s.getsockname()[0]
-        s.close()
-    except Exception:
-        local_ip = "unknown"
+    local_ip = _first_up_ipv4() or "unknown"
 
     hostname = socket.gethostname()
 
@@ -2,7 +2,6 @@
 
 import logging
 import urllib.parse
-import webbrowser
 
 from kabolai.actions.base import ActionResult
 from kabolai.actions.registry import registry
@@ -22,6 +21,8 @@ logger = logging.getLogger(__name__)
 )
 def web_search(query: str) -> ActionResult:
     """Open a web search in the default browser."""
+    import webbrowser
+
     encoded = urllib.parse.quote_plus(query)
     url = f"https://duckduckgo.com/?q={encoded}"
 
@@ -54,6 +55,8 @@ def web_search(query: str) -> ActionResult:
 )
 def open_url(url: str) -> ActionResult:
     """Open a URL in the default browser."""
+    import webbrowser
+
     if not url.startswith(("http://", "https://")):
         url = "https://" + url
 
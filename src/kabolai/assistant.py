@@ -5,16 +5,20 @@ Key feature: user can INTERRUPT at any time by speaking again.
 When interrupted, current pipeline is cancelled and new speech is processed.
 """
 
+import collections
+import inspect
 import logging
 import queue
 import threading
 import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from typing import Callable, Optional
 
 from kabolai.core.config import AppConfig
+from kabolai.core.constants import LANG_BY_CODE, LANG_CODES, Lang
 from kabolai.core.state import AssistantState
-from kabolai.audio.recorder import AudioRecorder
-from kabolai.audio.player import AudioPlayer
 from kabolai.stt.factory import create_stt_engine
 from kabolai.tts.factory import create_tts_engine
 from kabolai.brain.factory import create_brain
@@ -23,9 +27,90 @@ from kabolai.actions.conversation import set_state_ref
 
 logger = logging.getLogger(__name__)
 
+# Audio classes are imported on first use (see Assistant.recorder/player),
+# so an assistant that only checks the brain never loads sounddevice
+AudioRecorder = None
+AudioPlayer = None
+
 # Maximum time (seconds) for the entire voice pipeline before watchdog kills it
 PIPELINE_TIMEOUT = 20
 
+# Reusable event dicts kept by each assistant (see release_events)
+EVENT_POOL_SIZE = 64
+
+# Shared read-only payload for events emitted without data
+_EMPTY_DATA = types.MappingProxyType({})
+
+# Read-only payloads for the pipeline's status events
+_STATUS_DATA = {
+    state: types.MappingProxyType({"state": state})
+    for state in ("ready", "listening", "processing", "speaking")
+}
+
+# Shared by all Assistant instances for short-lived background work:
+# model loading at startup, TTS prefetch and streamed synthesis.
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="kabolai")
+
+
+def _accepts_language(stt) -> bool:
+    """True if stt.transcribe() takes a language= keyword."""
+    try:
+        params = inspect.signature(stt.transcribe).parameters
+    except (TypeError, ValueError):
+        return True
+    return "language" in params or any(
+        p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()
+    )
+
+
+def _safe_cleanup(component):
+    """Call component.cleanup(), logging instead of raising (runs on _EXECUTOR)."""
+    if component is None:
+        return
+    try:
+        component.cleanup()
+    except Exception as e:
+        logger.warning(f"Cleanup of {type(component).__name__} failed: {e}")
+
+
+def _cleanup_loaded(future):
+    """Done-callback that cleans up an engine finished after shutdown."""
+    if not future.cancelled() and future.exception() is None:
+        _safe_cleanup(future.result())
+
+
+def _warm_tts(config: AppConfig, lang: str):
+    """Create a TTS engine and load its models (runs on _EXECUTOR)."""
+    tts = create_tts_engine(config, lang=lang)
+    tts.warmup()
+    return tts
+
+
+# Synthesized speech chunks buffered ahead of playback
+TTS_STREAM_BUFFER = 4
+_STREAM_END = object()
+
+# Tells the continuous-speech worker to exit
+_WORKER_STOP = object()
+
+
+# Per-language (ActionResult speech attribute, action error message),
+# indexed by Lang
+_LANG_TABLE = (
+    ("speak_text_uk", "Помилка при виконанні команди."),
+    ("speak_text_en", "Error executing command."),
+)
+
+
+def _lang_index(lang: str) -> Lang:
+    """Lang for a language code; unknown codes fall back to English."""
+    return LANG_BY_CODE.get(lang, Lang.EN)
+
+
+# Action modules are imported once per process, not per Assistant
+_ACTIONS_REGISTERED = False
+_ACTIONS_LOCK = threading.Lock()
+
 
 class Assistant:
     """Main assistant that orchestrates the voice pipeline.
@@ -41,9 +126,19 @@ class Assistant:
         self.config = config
         self.state = AssistantState(language=config.language)
 
-        # Event system for GUI integration
-        self._event_callbacks = []
-        self._event_queue = queue.Queue()
+        # Event system for GUI integration. Callbacks are an immutable
+        # tuple (copy-on-write) and pending events sit in a deque, whose
+        # append/popleft are atomic, so emitting never takes a lock.
+        self._event_callbacks = ()
+        self._event_buf = collections.deque()
+        self._status_lock = threading.Lock()
+        # Queued status event not yet drained; a newer status supersedes it
+        self._status_event = None
+        self._event_pool = collections.deque(
+            ({"type": "", "data": _EMPTY_DATA, "time": 0.0}
+             for _ in range(EVENT_POOL_SIZE)),
+            maxlen=EVENT_POOL_SIZE,
+        )
 
         # TTS mute state (skip speech playback when True)
         self.tts_muted = False
@@ -52,90 +147,262 @@ class Assistant:
         self._cancel = threading.Event()
         self._pending_audio = None
         self._pending_lock = threading.Lock()
+        # Set whenever no pipeline run holds the voice lock; claiming and
+        # releasing update it under _claim_lock so waiters never see a
+        # claimed pipeline as idle
+        self._pipeline_idle = threading.Event()
+        self._pipeline_idle.set()
+        self._claim_lock = threading.Lock()
+
+        # Utterances from continuous mode are handed to one long-lived worker
+        # through a single slot; a newer utterance replaces one still waiting
+        self._speech_q = queue.Queue(maxsize=1)
+        self._speech_worker = None
 
         # Give conversation actions access to state
         set_state_ref(self.state)
 
-        # Initialize components
-        self.recorder = AudioRecorder(config.audio)
-        self.player = AudioPlayer(config.audio)
-        self.brain = create_brain(config)
-
-        # Import all action modules to trigger registration
-        self._register_actions()
-
-        # STT engine
+        # Load STT and the starting language's TTS in the background while
+        # the rest of the assistant is wired up. tts.preload_both also warms
+        # the other language's voice; tts.preload: false keeps TTS fully
+        # lazy on memory-constrained machines.
         logger.info("Initializing STT engine...")
-        self.stt = create_stt_engine(config)
-
-        # TTS engines (lazy-load only when needed)
-        logger.info("Initializing TTS engines...")
-        self._tts_en = None
-        self._tts_uk = None
+        stt_future = _EXECUTOR.submit(create_stt_engine, config)
+        # Loaded TTS engines and pending warm-ups, both keyed by Lang
+        self._tts = [None] * len(Lang)
+        self._tts_futures = {}
+        # Settings changes waiting for an engine that isn't loaded yet
+        self._tts_changes = {}
+        # Guards _tts, _tts_futures and _tts_changes; the per-language
+        # load locks make concurrent first uses share one engine
+        self._tts_lock = threading.Lock()
+        self._tts_load_locks = [threading.Lock() for _ in Lang]
+        if config.tts.get("preload", True):
+            logger.info("Warming up TTS engine...")
+            start_lang = _lang_index(config.language)
+            self._prefetch_tts(start_lang)
+            if config.tts.get("preload_both", False):
+                for lang in Lang:
+                    if lang != start_lang:
+                        self._prefetch_tts(lang)
+
+        # recorder, player and brain are created on first use
+
+        # STT engine (init errors still surface from the constructor)
+        self.stt = stt_future.result()
 
     # ---- Event System ----
 
     def add_event_callback(self, callback: Callable):
         """Register a callback for assistant events."""
-        self._event_callbacks.append(callback)
+        self._event_callbacks = self._event_callbacks + (callback,)
 
-    def _emit_event(self, event_type: str, data: dict = None):
-        """Emit an event to all registered callbacks and the event queue."""
-        event = {"type": event_type, "data": data or {}, "time": time.time()}
-        self._event_queue.put(event)
+    def _new_event(self, event_type: str, data: dict) -> dict:
+        try:
+            event = self._event_pool.pop()
+        except IndexError:
+            event = {}
+        event["type"] = event_type
+        event["data"] = data
+        event["time"] = time.time()
+        return event
+
+    def _notify(self, event_type: str, data: dict):
         for cb in self._event_callbacks:
             try:
-                cb(event_type, data or {})
+                cb(event_type, data)
             except Exception as e:
                 logger.error(f"Event callback error: {e}")
 
+    def _emit_event(self, event_type: str, data: dict = None):
+        """Emit an event to all registered callbacks and the event buffer."""
+        if data is None:
+            data = _EMPTY_DATA
+        self._event_buf.append(self._new_event(event_type, data))
+        self._notify(event_type, data)
+
+    def _set_status(self, state: str):
+        """Emit a pipeline status change.
+
+        Callbacks see every change. In the drain_events() buffer only the
+        latest status since the previous drain is kept, at the position it
+        was emitted, so quick listening -> processing -> speaking -> ready
+        runs collapse into a single event.
+        """
+        data = _STATUS_DATA.get(state) or {"state": state}
+        event = self._new_event("status", data)
+        with self._status_lock:
+            if self._status_event is not None:
+                # Still queued; drain_events() drops it
+                self._status_event["type"] = None
+            self._status_event = event
+            self._event_buf.append(event)
+        self._notify("status", data)
+
     def drain_events(self) -> list:
-        """Drain all pending events from the queue (for GUI polling)."""
-        events = []
-        while True:
-            try:
-                events.append(self._event_queue.get_nowait())
-            except queue.Empty:
-                break
+        """Drain all pending events from the buffer (for GUI polling)."""
+        buf = self._event_buf
+        with self._status_lock:
+            # Only take what is there now; concurrent emits land in the next drain
+            events = [buf.popleft() for _ in range(len(buf))]
+            self._status_event = None
+        superseded = [e for e in events if e["type"] is None]
+        if superseded:
+            events = [e for e in events if e["type"] is not None]
+            self.release_events(superseded)
         return events
 
+    def release_events(self, events: list):
+        """Return drained events to the pool once the caller is done with them."""
+        for event in events:
+            event["data"] = _EMPTY_DATA
+        self._event_pool.extend(events)
+
+    # ---- Components ----
+
+    @cached_property
+    def recorder(self):
+        global AudioRecorder
+        if AudioRecorder is None:
+            from kabolai.audio.recorder import AudioRecorder
+        return AudioRecorder(self.config.audio)
+
+    @cached_property
+    def player(self):
+        global AudioPlayer
+        if AudioPlayer is None:
+            from kabolai.audio.player import AudioPlayer
+        return AudioPlayer(self.config.audio)
+
+    @cached_property
+    def brain(self):
+        # The brain's prompt lists the registered actions
+        self._register_actions()
+        return create_brain(self.config)
+
     # ---- Action Registration ----
 
     def _register_actions(self):
-        """Import action modules so decorators register them."""
-        import kabolai.actions.apps  # noqa: F401
-        import kabolai.actions.system  # noqa: F401
-        import kabolai.actions.web  # noqa: F401
-        import kabolai.actions.media  # noqa: F401
-        import kabolai.actions.conversation  # noqa: F401
+        """Import action modules so decorators register them (once per process)."""
+        global _ACTIONS_REGISTERED
+        if _ACTIONS_REGISTERED:
+            return
+        with _ACTIONS_LOCK:
+            if _ACTIONS_REGISTERED:
+                return
+            import kabolai.actions.apps  # noqa: F401
+            import kabolai.actions.system  # noqa: F401
+            import kabolai.actions.web  # noqa: F401
+            import kabolai.actions.media  # noqa: F401
+            import kabolai.actions.conversation  # noqa: F401
+            _ACTIONS_REGISTERED = True
+
+    # ---- STT Engine ----
+
+    @property
+    def stt(self):
+        return self._stt
+
+    @stt.setter
+    def stt(self, engine):
+        # Resolve the calling convention once per engine, not per utterance
+        self._stt = engine
+        self._stt_takes_language = _accepts_language(engine)
 
     # ---- TTS Lazy Loading ----
 
+    def _load_tts(self, lang: Lang):
+        """Take the warmed-up engine for lang, or create one now."""
+        code = LANG_CODES[lang]
+        with self._tts_lock:
+            future = self._tts_futures.get(lang)
+        if future is not None:
+            try:
+                return future.result()
+            except Exception as e:
+                logger.warning(f"TTS warmup ({code}) failed, retrying: {e}")
+        return create_tts_engine(self.config, lang=code)
+
+    def _prefetch_tts(self, lang: Lang):
+        """Start loading the TTS engine for lang in the background if needed."""
+        with self._tts_lock:
+            if self._tts[lang] is None and lang not in self._tts_futures:
+                self._tts_futures[lang] = _EXECUTOR.submit(
+                    _warm_tts, self.config, LANG_CODES[lang]
+                )
+
+    def _tts_for(self, lang: Lang):
+        tts = self._tts[lang]
+        if tts is not None:
+            return tts
+        with self._tts_load_locks[lang]:
+            tts = self._tts[lang]
+            if tts is None:
+                tts = self._load_tts(lang)
+                with self._tts_lock:
+                    self._tts[lang] = tts
+                    self._tts_futures.pop(lang, None)
+                    changes = self._tts_changes.pop(lang, ())
+                for change in changes:
+                    self._apply_tts_change(tts, change)
+        return tts
+
+    @staticmethod
+    def _apply_tts_change(tts, change: Callable):
+        try:
+            change(tts)
+        except Exception as e:
+            logger.error(f"TTS settings change error: {e}")
+
+    def configure_tts(self, lang: Lang, change: Callable):
+        """Apply change(engine) to lang's TTS engine, now or once it loads.
+
+        Engines still warming up (or not created yet) get the change when
+        they are first used, so settings made meanwhile aren't lost.
+        """
+        with self._tts_lock:
+            tts = self._tts[lang]
+            if tts is None:
+                self._tts_changes.setdefault(lang, []).append(change)
+                return
+        self._apply_tts_change(tts, change)
+
     @property
     def tts_en(self):
-        if self._tts_en is None:
-            self._tts_en = create_tts_engine(self.config, lang="en")
-        return self._tts_en
+        return self._tts_for(Lang.EN)
 
     @property
     def tts_uk(self):
-        if self._tts_uk is None:
-            self._tts_uk = create_tts_engine(self.config, lang="uk")
-        return self._tts_uk
+        return self._tts_for(Lang.UK)
 
     # ---- Voice Pipeline ----
 
+    def _claim_pipeline(self) -> bool:
+        """Claim the voice pipeline and mark it busy in one step."""
+        with self._claim_lock:
+            if not self.state.try_start_pipeline():
+                return False
+            self._pipeline_idle.clear()
+            return True
+
+    def _release_pipeline(self):
+        """End the pipeline run and wake anyone waiting for it."""
+        with self._claim_lock:
+            self.state.end_pipeline()
+            self._pipeline_idle.set()
+
     def handle_voice(self):
         """Record and process a voice command (push-to-talk mode).
 
         If pipeline is busy, FORCE-CANCEL it and start fresh.
         User pressing the mic button always wins.
         """
-        if not self.state.try_start_pipeline():
+        if not self._claim_pipeline():
             # Pipeline busy — force cancel and take over
             logger.info("[Push-to-talk] Interrupting busy pipeline...")
             self.interrupt()
-            time.sleep(0.15)
+            # Proceed as soon as the running pipeline lets go
+            self._pipeline_idle.wait(timeout=0.15)
             # Force-reset if still stuck
             if self.state.is_busy:
                 self.state.force_reset()
@@ -143,74 +410,82 @@ class Assistant:
                     self.state._voice_lock.release()
                 except RuntimeError:
                     pass
-            if not self.state.try_start_pipeline():
+            if not self._claim_pipeline():
                 logger.warning("[Push-to-talk] Could not acquire pipeline after interrupt.")
                 return
 
         self._cancel.clear()
         try:
-            self._emit_event("status", {"state": "listening"})
+            self._set_status("listening")
             self.state.set_listening(True)
 
             audio = self.recorder.record()
             self.state.set_listening(False)
 
             if audio is None:
-                self._emit_event("status", {"state": "ready"})
+                self._set_status("ready")
                 return
 
             self.state.set_processing(True)
-            self._emit_event("status", {"state": "processing"})
+            self._set_status("processing")
             self._process(audio)
 
         except Exception as e:
             logger.error(f"Voice pipeline error: {e}", exc_info=True)
             self._emit_event("error", {"message": str(e)})
         finally:
-            self.state.end_pipeline()
-            self._emit_event("status", {"state": "ready"})
+            self._release_pipeline()
+            self._set_status("ready")
 
     def _process(self, audio_data) -> Optional[str]:
         """Full pipeline: audio -> STT -> brain -> action -> TTS."""
+        # Snapshot per-run values into locals once
         lang = self.state.language
+        lang_idx = _lang_index(lang)
+        speak_attr, error_text = _LANG_TABLE[lang_idx]
+        is_cancelled = self._cancel.is_set
+        emit = self._emit_event
 
         # Check cancel before STT
-        if self._cancel.is_set():
+        if is_cancelled():
             logger.info("[Pipeline] Cancelled before STT.")
             return None
 
         # Step 1: STT
-        if hasattr(self.stt, 'transcribe'):
-            try:
-                result = self.stt.transcribe(audio_data, language=lang)
-            except TypeError:
-                result = self.stt.transcribe(audio_data)
+        stt = self._stt
+        if self._stt_takes_language:
+            result = stt.transcribe(audio_data, language=lang)
         else:
-            result = self.stt.transcribe(audio_data)
+            result = stt.transcribe(audio_data)
 
-        if not result.text.strip():
+        user_text = result.text.strip()
+        if not user_text:
             logger.info("[STT] No speech detected in audio.")
             return None
 
-        user_text = result.text.strip()
-        logger.info(f"[STT] ({lang}): {user_text}")
-        self._emit_event("user_text", {"text": user_text, "language": lang})
+        logger.info("[STT] (%s): %s", lang, user_text)
+        emit("user_text", {"text": user_text, "language": lang})
 
         # Check cancel before brain
-        if self._cancel.is_set():
+        if is_cancelled():
             logger.info("[Pipeline] Cancelled before brain.")
             return None
 
+        # Load the voice for this language while the brain is thinking
+        self._prefetch_tts(lang_idx)
+
         # Step 2: Brain - parse intent
         brain_response = self.brain.process(user_text, lang)
-        logger.info(
-            f"[Brain] action={brain_response.command}, "
-            f"conv={brain_response.is_conversation}, "
-            f"resp='{brain_response.response_text[:80]}'"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[Brain] action=%s, conv=%s, resp='%s'",
+                brain_response.command,
+                brain_response.is_conversation,
+                brain_response.response_text[:80],
+            )
 
         # Check cancel before action
-        if self._cancel.is_set():
+        if is_cancelled():
             logger.info("[Pipeline] Cancelled before action.")
             return None
 
@@ -218,35 +493,32 @@ class Assistant:
         response_text = brain_response.response_text
 
         if brain_response.command and not brain_response.is_conversation:
+            command = brain_response.command
             try:
-                action_result = registry.execute(
-                    brain_response.command.action,
-                    brain_response.command.params,
-                )
+                action_result = registry.execute(command.action, command.params)
                 logger.info(
-                    f"[Action] {brain_response.command.action} -> "
-                    f"success={action_result.success}, msg='{action_result.message}'"
+                    "[Action] %s -> success=%s, msg='%s'",
+                    command.action,
+                    action_result.success,
+                    action_result.message,
                 )
 
                 if action_result.success:
-                    speak = (
-                        action_result.speak_text_uk if lang == "uk"
-                        else action_result.speak_text_en
-                    )
+                    speak = getattr(action_result, speak_attr)
                     if speak:
                         response_text = speak
             except Exception as e:
-                logger.error(f"[Action] Error: {e}", exc_info=True)
-                response_text = (
-                    "Помилка при виконанні команди."
-                    if lang == "uk"
-                    else "Error executing command."
-                )
+                logger.error("[Action] Error: %s", e, exc_info=True)
+                response_text = error_text
+
+        # Silent action: nothing to show or say
+        if not response_text or response_text.isspace():
+            return response_text
 
-        self._emit_event("response_text", {"text": response_text, "language": lang})
+        emit("response_text", {"text": response_text, "language": lang})
 
         # Check cancel before TTS
-        if self._cancel.is_set():
+        if is_cancelled():
             logger.info("[Pipeline] Cancelled before TTS.")
             return response_text
 
@@ -259,7 +531,9 @@ class Assistant:
         """Synthesize and play speech with proper state management."""
         self.state.set_processing(False)
 
-        # Skip TTS when muted or cancelled
+        # Skip TTS when there is nothing to say, or when muted or cancelled
+        if not text or text.isspace():
+            return
         if self.tts_muted:
             logger.info("[TTS] Muted — skipping speech playback.")
             return
@@ -267,39 +541,85 @@ class Assistant:
             logger.info("[TTS] Cancelled — skipping speech.")
             return
 
-        self.state.set_speaking(True)
-        self._emit_event("status", {"state": "speaking"})
-
-        # Set a SHORT cooldown so continuous listener doesn't hear
-        # the very start of TTS playback. The _wait_with_timeout in
-        # the player blocks until playback finishes, so we don't need
-        # a long estimated cooldown — just enough to skip the audio start.
-        if self.is_continuous:
-            self.recorder.set_cooldown(0.5)
+        speaking = False
+        continuous = self.is_continuous
+
+        def audible(chunks):
+            # Enter the speaking state only once there is audio to play
+            nonlocal speaking
+            for speech in chunks:
+                if not speaking and speech.audio_data:
+                    speaking = True
+                    self.state.set_speaking(True)
+                    self._set_status("speaking")
+                    # Set a SHORT cooldown so continuous listener doesn't hear
+                    # the very start of TTS playback. play_stream in the player
+                    # blocks until playback finishes, so we don't need
+                    # a long estimated cooldown — just enough to skip the audio start.
+                    if continuous:
+                        self.recorder.set_cooldown(0.5)
+                yield speech
 
         try:
-            tts = self.tts_uk if lang == "uk" else self.tts_en
-            speech = tts.synthesize(text)
-
-            # Check cancel after synthesis (before playback)
-            if self._cancel.is_set():
-                logger.info("[TTS] Cancelled after synthesis, skipping playback.")
-                return
-
-            if speech.audio_data:
-                if speech.format == "wav":
-                    self.player.play_wav(speech.audio_data)
-                else:
-                    self.player.play_bytes(
-                        speech.audio_data, speech.sample_rate
-                    )
+            tts = self._tts_for(_lang_index(lang))
+            self.player.play_stream(audible(self._stream_speech(tts, text)))
         except Exception as e:
             logger.error(f"[TTS/Playback] Error: {e}", exc_info=True)
         finally:
-            self.state.set_speaking(False)
-            # Brief cooldown after playback to avoid hearing echo/reverb
-            if self.is_continuous:
-                self.recorder.set_cooldown(0.8)
+            if speaking:
+                self.state.set_speaking(False)
+                # Brief cooldown after playback to avoid hearing echo/reverb
+                if continuous:
+                    self.recorder.set_cooldown(0.8)
+
+    def _stream_speech(self, tts, text: str):
+        """Yield speech chunks while later ones synthesize in the background.
+
+        Stops early (and lets the producer exit) once the pipeline is
+        cancelled.
+        """
+        chunks = queue.Queue(maxsize=TTS_STREAM_BUFFER)
+        done = threading.Event()
+
+        def put(item) -> bool:
+            while not done.is_set():
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce():
+            try:
+                for speech in tts.synthesize_stream(text):
+                    if self._cancel.is_set() or not put(speech):
+                        return
+            except Exception as e:
+                put(e)
+            finally:
+                put(_STREAM_END)
+
+        producer = _EXECUTOR.submit(produce)
+        try:
+            while True:
+                try:
+                    item = chunks.get(timeout=0.1)
+                except queue.Empty:
+                    item = None
+                if self._cancel.is_set():
+                    logger.info("[TTS] Cancelled — stopping speech stream.")
+                    return
+                if item is None:
+                    continue
+                if item is _STREAM_END:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            done.set()
+            producer.cancel()  # no-op unless it never got a worker
 
     def speak(self, text: str, lang: str = None):
         """Speak text in the specified or current language."""
@@ -315,11 +635,13 @@ class Assistant:
         The cancel flag is checked at multiple points in _process().
         """
         self._cancel.set()
-        # Stop any ongoing audio playback immediately
-        try:
-            self.player.stop()
-        except Exception:
-            pass
+        # Stop any ongoing audio playback immediately (nothing plays if the
+        # player was never created)
+        if "player" in self.__dict__:
+            try:
+                self.player.stop()
+            except Exception:
+                pass
         logger.info("[Interrupt] Pipeline cancel signal sent + audio stopped.")
 
     # ---- Continuous Listening Mode ----
@@ -333,7 +655,7 @@ class Assistant:
         pipeline and processes the new speech instead.
         """
         logger.info("Starting continuous listening mode.")
-        self._emit_event("status", {"state": "ready"})
+        self._set_status("ready")
 
         def on_speech_detected(audio_data):
             """Called by continuous listener — MUST return fast."""
@@ -348,56 +670,88 @@ class Assistant:
                     self._pending_audio = audio_data
                 return
 
-            # Pipeline free — process in a separate thread
-            threading.Thread(
-                target=self._process_continuous_speech,
-                args=(audio_data,),
-                daemon=True,
-            ).start()
+            # Pipeline free — hand off to the speech worker
+            self._hand_off(audio_data)
 
+        if self._speech_worker is None:
+            self._speech_worker = threading.Thread(
+                target=self._speech_worker_loop, daemon=True, name="speech-worker"
+            )
+            self._speech_worker.start()
         self.recorder.start_continuous(on_speech_detected)
 
+    def _hand_off(self, item):
+        """Put item in the speech slot, dropping a stale utterance if full."""
+        while True:
+            try:
+                self._speech_q.put_nowait(item)
+                return
+            except queue.Full:
+                pass
+            try:
+                stale = self._speech_q.get_nowait()
+            except queue.Empty:
+                continue
+            if stale is _WORKER_STOP:
+                # Shutting down: the stop request wins over new speech
+                item = stale
+            else:
+                logger.debug("Dropped a stale utterance for a newer one.")
+
+    def _speech_worker_loop(self):
+        """Run the pipeline for each utterance queued by continuous mode."""
+        while True:
+            audio_data = self._speech_q.get()
+            if audio_data is _WORKER_STOP:
+                return
+            self._process_continuous_speech(audio_data)
+
     def _process_continuous_speech(self, audio_data):
-        """Process speech from continuous listener in a separate thread."""
-        if not self.state.try_start_pipeline():
+        """Process speech from continuous listener on the speech worker.
+
+        Audio queued by an interrupt while a run is in progress is handled
+        in the same loop, keeping the pipeline claimed in between.
+        """
+        if not self._claim_pipeline():
             # Pipeline was claimed between our check and now — queue it
             with self._pending_lock:
                 self._pending_audio = audio_data
             logger.debug("Pipeline lock contention — queued audio.")
             return
 
-        self._cancel.clear()
+        audio = audio_data
         try:
-            self.state.set_processing(True)
-            self._emit_event("status", {"state": "processing"})
-            self._process(audio_data)
-        except Exception as e:
-            logger.error(f"Continuous pipeline error: {e}", exc_info=True)
-            self._emit_event("error", {"message": str(e)})
+            while audio is not None:
+                self._cancel.clear()
+                try:
+                    self.state.set_processing(True)
+                    self._set_status("processing")
+                    self._process(audio)
+                except Exception as e:
+                    logger.error(f"Continuous pipeline error: {e}", exc_info=True)
+                    self._emit_event("error", {"message": str(e)})
+
+                # Pick up any audio queued by an interrupt during this run
+                with self._pending_lock:
+                    audio, self._pending_audio = self._pending_audio, None
+                if audio is not None:
+                    logger.info("[Continuous] Processing queued interrupt audio.")
+                    self.state.renew_pipeline()
         finally:
-            self.state.end_pipeline()
-            self._emit_event("status", {"state": "ready"})
-
-        # After current pipeline finishes, process any pending audio
-        # from interrupt
-        pending = None
-        with self._pending_lock:
-            pending = self._pending_audio
-            self._pending_audio = None
-
-        if pending is not None:
-            logger.info("[Continuous] Processing queued interrupt audio.")
-            self._process_continuous_speech(pending)
+            self._release_pipeline()
+            self._set_status("ready")
 
     def stop_continuous(self):
         """Stop always-listening mode."""
         logger.info("Stopping continuous listening mode.")
-        self.recorder.stop_continuous()
+        if "recorder" in self.__dict__:
+            self.recorder.stop_continuous()
 
     @property
     def is_continuous(self) -> bool:
         """True if continuous listening mode is active."""
-        return self.recorder._continuous
+        # Reading this must not create the recorder (e.g. when only speaking)
+        return "recorder" in self.__dict__ and self.recorder._continuous
 
     def reset(self):
         """Emergency reset — clear all state, recover from any hang.
@@ -410,24 +764,29 @@ class Assistant:
 
         # Cancel any running pipeline
         self._cancel.set()
-        self.player.stop()
+        created = self.__dict__
+        if "player" in created:
+            self.player.stop()
 
         # Force-clear all state
-        self.state.force_reset()
-        try:
-            self.state._voice_lock.release()
-        except RuntimeError:
-            pass
+        with self._claim_lock:
+            self.state.force_reset()
+            try:
+                self.state._voice_lock.release()
+            except RuntimeError:
+                pass
+            self._pipeline_idle.set()
 
         # Clear pending audio
         with self._pending_lock:
             self._pending_audio = None
 
-        # Clear cooldown
-        self.recorder._cooldown_until = 0
+        # Clear cooldown and stop listening
+        if "recorder" in created:
+            self.recorder._cooldown_chunks = 0
+            self.recorder.stop_continuous()
 
-        # Stop and restart continuous if needed
-        self.recorder.stop_continuous()
+        # Restart continuous if needed
         if was_continuous:
             time.sleep(0.2)
             self._cancel.clear()
@@ -436,7 +795,7 @@ class Assistant:
         else:
             self._cancel.clear()
 
-        self._emit_event("status", {"state": "ready"})
+        self._set_status("ready")
         logger.info("[Reset] Complete — assistant ready.")
 
     def check_brain(self) -> bool:
@@ -448,14 +807,30 @@ class Assistant:
         logger.info("Shutting down assistant...")
         self._cancel.set()
         self.state.shutdown()
-        self.recorder.stop_continuous()
-        self.player.stop()
-        self.recorder.stop()
-        self.stt.cleanup()
-        if self._tts_en:
-            self._tts_en.cleanup()
-        if self._tts_uk:
-            self._tts_uk.cleanup()
-        self.brain.cleanup()
-        self.recorder.cleanup()
+        # Components that were never used are not created just to be closed
+        created = self.__dict__
+        if "recorder" in created:
+            self.recorder.stop_continuous()
+        if self._speech_worker is not None:
+            self._hand_off(_WORKER_STOP)
+        if "player" in created:
+            self.player.stop()
+        if "recorder" in created:
+            self.recorder.stop()
+
+        with self._tts_lock:
+            engines = list(self._tts)
+            futures = list(self._tts_futures.values())
+        components = [self.stt, *engines, created.get("brain"), created.get("recorder")]
+        for future in futures:
+            if future.cancel():
+                continue
+            if future.done():
+                if future.exception() is None:
+                    components.append(future.result())
+            else:
+                # Still loading: release the engine once it arrives
+                future.add_done_callback(_cleanup_loaded)
+        # Each component frees its own models/devices; do them side by side
+        list(_EXECUTOR.map(_safe_cleanup, components))
         logger.info("Assistant shut down.")
@@ -2,6 +2,7 @@
 
 import io
 import logging
+import threading
 import time
 
 import numpy as np
@@ -15,46 +16,74 @@ logger = logging.getLogger(__name__)
 # Maximum seconds any single playback can last
 PLAYBACK_TIMEOUT = 30
 
+# Streamed audio is written in blocks this long so stop() takes effect quickly
+STREAM_BLOCK_SECONDS = 0.1
+
+
+def _decode_chunk(chunk):
+    """Return (int16 frames x channels, sample_rate) for a SpeechResult."""
+    if chunk.format == "wav":
+        # TTS WAVs are 16-bit PCM; decode without widening
+        with io.BytesIO(chunk.audio_data) as buf:
+            return sf.read(buf, dtype="int16", always_2d=True)
+    # Raw PCM goes to PortAudio as int16, straight from the bytes
+    audio = np.frombuffer(chunk.audio_data, dtype=np.int16)
+    return audio.reshape(-1, 1), chunk.sample_rate
+
 
 class AudioPlayer:
     """Plays audio data through speakers with timeout and cancel support.
 
-    The _stopped event can be set externally (by assistant.interrupt())
+    stop() can be called from another thread (by assistant.interrupt())
     to immediately halt playback mid-sentence.
     """
 
     def __init__(self, config=None):
         self._config = config
-        self._stopped = False
+        # Bumped by stop(); streaming playback aborts when it changes
+        self._stop_count = 0
+        self._stream = None
 
-    def _wait_with_timeout(self, timeout: float = PLAYBACK_TIMEOUT):
-        """Wait for playback with timeout and cancel support.
+    def _play(self, data: np.ndarray, sample_rate: int, timeout: float = PLAYBACK_TIMEOUT):
+        """Play a buffer on its own output stream and block until it ends.
 
-        Checks self._stopped every 50ms — when set, halts immediately.
-        This enables instant interrupt when the user speaks.
+        The stream's finished_callback sets an event, so the caller sleeps
+        until playback completes, stop() aborts it, or the timeout expires.
         """
-        start = time.monotonic()
-        while True:
-            # Check cancel/stop flag
-            if self._stopped:
-                sd.stop()
-                return
-
-            elapsed = time.monotonic() - start
-            if elapsed > timeout:
+        if data.ndim == 1:
+            data = data.reshape(-1, 1)
+        done = threading.Event()
+        pos = 0
+
+        def callback(outdata, frames, time_info, status):
+            nonlocal pos
+            chunk = data[pos:pos + frames]
+            n = len(chunk)
+            outdata[:n] = chunk
+            pos += n
+            if n < frames:
+                outdata[n:] = 0
+                raise sd.CallbackStop
+
+        stop_count = self._stop_count
+        stream = sd.OutputStream(
+            samplerate=sample_rate, channels=data.shape[1], dtype=data.dtype,
+            callback=callback, finished_callback=done.set,
+        )
+        self._stream = stream
+        try:
+            stream.start()
+            # stop() may have run before the stream was published
+            if self._stop_count != stop_count:
+                stream.abort()
+            elif not done.wait(timeout):
                 logger.warning(
                     f"Playback timed out after {timeout:.0f}s — force stopping."
                 )
-                sd.stop()
-                return
-            # Check if playback is still active
-            try:
-                stream = sd.get_stream()
-                if stream is None or not stream.active:
-                    return
-            except Exception:
-                return
-            time.sleep(0.05)
+                stream.abort()
+        finally:
+            self._stream = None
+            stream.close()
 
     def play_bytes(self, audio_bytes: bytes, sample_rate: int = 22050, channels: int = 1):
         """Play raw PCM int16 audio bytes."""
@@ -62,9 +91,8 @@ class AudioPlayer:
             audio = np.frombuffer(audio_bytes, dtype=np.int16)
             if channels > 1:
                 audio = audio.reshape(-1, channels)
-            audio_float = audio.astype(np.float32) / 32768.0
-            sd.play(audio_float, samplerate=sample_rate)
-            self._wait_with_timeout()
+            # PortAudio takes int16 natively; no float copy needed
+            self._play(audio, sample_rate)
         except AudioError:
             raise
         except Exception as e:
@@ -74,9 +102,9 @@ class AudioPlayer:
         """Play WAV-formatted audio bytes."""
         try:
             with io.BytesIO(wav_bytes) as buf:
-                data, sample_rate = sf.read(buf)
-            sd.play(data, samplerate=sample_rate)
-            self._wait_with_timeout()
+                # TTS WAVs are 16-bit PCM; decode without widening
+                data, sample_rate = sf.read(buf, dtype="int16")
+            self._play(data, sample_rate)
         except AudioError:
             raise
         except Exception as e:
@@ -85,23 +113,73 @@ class AudioPlayer:
     def play_file(self, filepath: str):
         """Play an audio file."""
         try:
-            data, sample_rate = sf.read(filepath)
-            sd.play(data, samplerate=sample_rate)
-            self._wait_with_timeout()
+            data, sample_rate = sf.read(filepath, dtype="int16")
+            self._play(data, sample_rate)
         except AudioError:
             raise
         except Exception as e:
             raise AudioError(f"File playback error: {e}") from e
 
+    def play_stream(self, chunks, timeout: float = PLAYBACK_TIMEOUT):
+        """Play speech chunks back to back as they arrive.
+
+        chunks yields SpeechResult-like objects ("wav" or raw int16). Audio
+        goes to one output stream in short blocks, so stop() halts playback
+        within a block and later chunks can still be synthesizing.
+        """
+        stop_count = self._stop_count
+        stream = None
+        completed = False
+        try:
+            for chunk in chunks:
+                if not chunk.audio_data:
+                    continue
+                audio, sample_rate = _decode_chunk(chunk)
+                channels = audio.shape[1]
+                if (stream is None or stream.samplerate != sample_rate
+                        or stream.channels != channels
+                        or stream.dtype != audio.dtype.name):
+                    if stream is not None:
+                        stream.stop()
+                        stream.close()
+                    stream = sd.OutputStream(
+                        samplerate=sample_rate, channels=channels, dtype=audio.dtype
+                    )
+                    stream.start()
+
+                block = max(1, int(sample_rate * STREAM_BLOCK_SECONDS))
+                deadline = time.monotonic() + timeout
+                for start in range(0, len(audio), block):
+                    if self._stop_count != stop_count:
+                        return
+                    if time.monotonic() > deadline:
+                        logger.warning(
+                            f"Playback timed out after {timeout:.0f}s — force stopping."
+                        )
+                        return
+                    stream.write(audio[start:start + block])
+            completed = True
+        except AudioError:
+            raise
+        except Exception as e:
+            raise AudioError(f"Stream playback error: {e}") from e
+        finally:
+            if stream is not None:
+                if completed:
+                    stream.stop()  # let the tail play out
+                else:
+                    stream.abort()
+                stream.close()
+
     def stop(self):
         """Stop current playback immediately."""
-        self._stopped = True
-        try:
-            sd.stop()
-        except Exception:
-            pass
-        # Reset flag after stopping
-        self._stopped = False
+        self._stop_count += 1
+        stream = self._stream
+        if stream is not None:
+            try:
+                stream.abort()
+            except Exception:
+                pass
 
     def cleanup(self):
         """Release resources."""
@@ -6,12 +6,11 @@ Key features:
 - Interrupt-friendly: continuous mode detects speech even while pipeline is busy
 """
 
-import collections
+import functools
 import logging
 import queue
 import threading
-import time
-from typing import Callable, Optional
+from typing import Callable, ClassVar, Optional
 
 import numpy as np
 import sounddevice as sd
@@ -35,6 +34,184 @@ CALIBRATION_DURATION = 1.0  # seconds of ambient noise to record
 SPEECH_MULTIPLIER = 3.0     # speech threshold = ambient * this
 MIN_SPEECH_THRESHOLD = 100  # absolute minimum speech threshold
 
+# Continuous mode tracks the ambient noise floor from quiet chunks: it
+# drops at once to a quieter chunk but at most doubles over this many
+# seconds, so noise just under the threshold can't ratchet it up quickly
+AMBIENT_ADAPT_SECONDS = 5.0
+
+# Audio blocks buffered between the PortAudio callback and the reader
+# (a power of two, so slots are picked with a bit mask)
+RING_SIZE = 16
+
+# webrtcvad only accepts these sample rates, in 10/20/30 ms frames
+WEBRTC_SAMPLE_RATES = (8000, 16000, 32000, 48000)
+WEBRTC_FRAME_MS = 30
+WEBRTC_AGGRESSIVENESS = 2
+
+# Input devices reported by list_devices(), filled on first call
+_input_devices: Optional[list] = None
+
+
+def _sum_squares(samples: np.ndarray, sq_buf: Optional[np.ndarray] = None) -> int:
+    """Sum of squared int16 samples.
+
+    int16 squares fit in int32 and their sum in int64, so this stays in
+    integer arithmetic with no float copy of the chunk. (np.dot/np.vdot
+    would accumulate int16 in int16 and overflow.) Passing an int32
+    sq_buf at least as long as the chunk avoids allocating the squares.
+    """
+    samples = samples.reshape(-1)
+    if sq_buf is not None and sq_buf.size >= samples.size:
+        sq = np.multiply(samples, samples, out=sq_buf[:samples.size], dtype=np.int32)
+    else:
+        sq = np.multiply(samples, samples, dtype=np.int32)
+    return int(sq.sum(dtype=np.int64))
+
+
+def _rms(samples: np.ndarray, sq_buf: Optional[np.ndarray] = None) -> float:
+    """Root-mean-square level of int16 samples."""
+    if not samples.size:
+        return 0.0
+    return float(np.sqrt(_sum_squares(samples, sq_buf) / samples.size))
+
+
+def _vad_step(chunk, speech_threshold, recording, silence_count, speech_count,
+              sq_buf=None):
+    """Measure one chunk and advance the voice-detection counters.
+
+    Returns (rms, recording, silence_count, speech_count). Crossing the
+    threshold while idle starts a new recording with speech_count = 1.
+    """
+    rms = _rms(chunk, sq_buf)
+    if rms >= speech_threshold:
+        return rms, True, 0, speech_count + 1 if recording else 1
+    if recording:
+        silence_count += 1
+    return rms, recording, silence_count, speech_count
+
+
+def _compile_vad_step():
+    """Return a numba-compiled _vad_step, or the numpy one without numba."""
+    try:
+        from numba import njit
+    except ImportError:
+        return _vad_step
+
+    @njit(cache=True, fastmath=True)
+    def vad_step(chunk, speech_threshold, recording, silence_count, speech_count):
+        total = np.int64(0)
+        for x in chunk:
+            total += np.int64(x) * np.int64(x)
+        rms = np.sqrt(total / max(chunk.size, 1))
+        if rms >= speech_threshold:
+            return rms, True, 0, speech_count + 1 if recording else 1
+        if recording:
+            silence_count += 1
+        return rms, recording, silence_count, speech_count
+
+    return vad_step
+
+
+def _webrtc_vad_step(sample_rate: int, required: bool = False):
+    """Return a webrtcvad-backed _vad_step, or None if it can't be used.
+
+    A chunk counts as speech when at least half of its 30 ms frames are
+    voiced. RMS is still returned for ambient tracking and logging; the
+    speech_threshold argument is ignored.
+    """
+    try:
+        import webrtcvad
+    except ImportError:
+        if required:
+            logger.warning("webrtcvad is not installed — using energy VAD.")
+        return None
+    if sample_rate not in WEBRTC_SAMPLE_RATES:
+        if required:
+            logger.warning(
+                f"webrtcvad does not support {sample_rate} Hz — using energy VAD."
+            )
+        return None
+
+    vad = webrtcvad.Vad(WEBRTC_AGGRESSIVENESS)
+    frame_bytes = sample_rate * WEBRTC_FRAME_MS // 1000 * 2
+
+    def vad_step(chunk, speech_threshold, recording, silence_count, speech_count,
+                 sq_buf=None):
+        rms = _rms(chunk, sq_buf)
+        data = chunk.tobytes()
+        frames = len(data) // frame_bytes
+        voiced = sum(
+            vad.is_speech(data[i:i + frame_bytes], sample_rate)
+            for i in range(0, frames * frame_bytes, frame_bytes)
+        )
+        if frames and 2 * voiced >= frames:
+            return rms, True, 0, speech_count + 1 if recording else 1
+        if recording:
+            silence_count += 1
+        return rms, recording, silence_count, speech_count
+
+    return vad_step
+
+
+class _ChunkRing:
+    """Preallocated int16 blocks passed from the audio callback to one reader.
+
+    The callback copies each block into the next slot, so the real-time
+    thread never allocates or takes a queue lock. get() returns a view
+    into a slot, valid until RING_SIZE more blocks arrive; if the reader
+    falls that far behind, the oldest blocks are dropped.
+
+    Multi-channel input is averaged down to mono as it is copied in, since
+    everything downstream (VAD, STT) works on one channel.
+    """
+
+    def __init__(self, frames: int, channels: int, size: int = RING_SIZE):
+        self._slots = np.zeros((size, frames, 1), dtype=np.int16)
+        self._lens = [0] * size
+        # Scratch for the int32 channel sum when downmixing
+        self._mix = np.empty(frames, dtype=np.int32) if channels > 1 else None
+        if size & (size - 1):
+            raise ValueError(f"ring size must be a power of two, got {size}")
+        self._size = size
+        self._mask = size - 1
+        self._written = 0  # only advanced by the callback
+        self._read = 0     # only advanced by the reader
+        self._ready = threading.Event()
+
+    def reset(self):
+        self._written = self._read = 0
+        self._ready.clear()
+
+    def put(self, indata):
+        """Copy one block in (audio callback thread)."""
+        slot = self._written & self._mask
+        n = min(len(indata), self._slots.shape[1])
+        if self._mix is None:
+            np.copyto(self._slots[slot, :n], indata[:n])
+        else:
+            mix = self._mix[:n]
+            np.sum(indata[:n], axis=1, dtype=np.int32, out=mix)
+            mix //= indata.shape[1]
+            np.copyto(self._slots[slot, :n, 0], mix, casting="unsafe")
+        self._lens[slot] = n
+        self._written += 1
+        self._ready.set()
+
+    def get(self, timeout: float) -> np.ndarray:
+        """Return the next block, or raise queue.Empty after timeout."""
+        if self._read == self._written:
+            self._ready.clear()
+            # Re-check so a put() between the test and clear() isn't missed
+            if self._read == self._written and not self._ready.wait(timeout):
+                raise queue.Empty
+        behind = self._written - self._read
+        if behind > self._size:
+            logger.warning(f"Audio reader fell behind, dropped {behind - self._size} blocks")
+            self._read = self._written - self._size
+        slot = self._read & self._mask
+        self._read += 1
+        return self._slots[slot, :self._lens[slot]]
+
 
 class AudioRecorder:
     """Records audio from microphone with auto-calibrated voice detection.
@@ -44,37 +221,90 @@ class AudioRecorder:
     microphone sensitivity or background noise level.
     """
 
-    def __init__(self, config: AudioConfig):
-        self.sample_rate = config.sample_rate
-        self.channels = config.channels
-        self.chunk_size = config.chunk_size
-        self.silence_threshold = config.silence_threshold
-        self.silence_duration = config.silence_duration
-        self.max_record_seconds = config.max_record_seconds
+    # Device info by index, shared by every recorder in the process
+    _device_cache: ClassVar[dict] = {}
 
-        self._audio_queue: queue.Queue = queue.Queue()
+    def __init__(self, config: AudioConfig):
+        self._apply_config(config)
         self._is_recording = False
         self._record_event = threading.Event()
+        # record() writes into these in turn (allocated on first use)
+        self._record_bufs: list[Optional[np.ndarray]] = [None, None]
+        self._record_buf_idx = 0
 
         # Continuous listening state
         self._continuous = False
         self._continuous_thread: Optional[threading.Thread] = None
         self._on_speech_callback: Optional[Callable] = None
-        self._cooldown_until: float = 0.0
+        # Chunks still to ignore after TTS playback (counted down per chunk)
+        self._cooldown_chunks = 0
 
         # Auto-calibration
         self._calibrated = False
         self._ambient_rms: float = 0.0
         self._speech_threshold: float = float(config.silence_threshold)
 
+        # Continuous-mode VAD step, chosen and compiled by start_continuous()
+        # so push-to-talk never pays for it. Python steps take an sq_buf
+        # scratch array; the numba one squares without allocating anyway.
+        self._vad_step: Optional[Callable] = None
+        self._vad_takes_sq_buf = False
+
         # Log audio device info
         self._log_device_info()
 
+    def _apply_config(self, config: AudioConfig):
+        """Take audio settings from config and derive the per-chunk limits."""
+        self.sample_rate = config.sample_rate
+        self.channels = config.channels
+        self.chunk_size = config.chunk_size
+        self.silence_threshold = config.silence_threshold
+        self.silence_duration = config.silence_duration
+        self.max_record_seconds = config.max_record_seconds
+        self.vad = config.vad
+
+        # Durations converted to chunk counts once, not on every recording
+        chunks_per_second = self.sample_rate / self.chunk_size
+        self._chunks_per_second = chunks_per_second
+        self._silence_chunks = int(self.silence_duration * chunks_per_second)
+        self._max_chunks = int(self.max_record_seconds * chunks_per_second)
+        self._min_speech_chunks = int(MIN_SPEECH_DURATION * chunks_per_second)
+        self._pre_buffer_size = max(1, int(PRE_BUFFER_DURATION * chunks_per_second))
+        # Largest per-chunk growth factor of the ambient noise floor
+        self._ambient_rise = 2.0 ** (1.0 / max(1.0, AMBIENT_ADAPT_SECONDS * chunks_per_second))
+
+        self._ring = _ChunkRing(self.chunk_size, self.channels)
+        # Continuous-mode pre-buffer blocks and their filled lengths
+        self._pre_ring = np.zeros(
+            (self._pre_buffer_size, self.chunk_size, 1), dtype=np.int16
+        )
+        self._pre_lens = [0] * self._pre_buffer_size
+
+    def _select_vad(self):
+        """Set up the continuous-mode VAD step for the configured mode."""
+        step = None
+        if self.vad in ("auto", "webrtc"):
+            step = _webrtc_vad_step(self.sample_rate, required=self.vad == "webrtc")
+        takes_sq_buf = step is not None
+        if step is None:
+            step = _compile_vad_step()
+            takes_sq_buf = step is _vad_step
+        # Compile/warm up the VAD before listening starts, not on the first chunk
+        step(np.zeros(self.chunk_size, dtype=np.int16), 1.0, False, 0, 0)
+        self._vad_step = step
+        self._vad_takes_sq_buf = takes_sq_buf
+
     def _log_device_info(self):
         """Log which audio input device is being used."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
         try:
             default_idx = sd.default.device[0]
-            device = sd.query_devices(default_idx)
+            device = self._device_cache.get(default_idx)
+            if device is None:
+                device = self._device_cache.setdefault(
+                    default_idx, sd.query_devices(default_idx)
+                )
             logger.info(
                 f"Audio input: [{default_idx}] {device['name']} "
                 f"(native {device['default_samplerate']:.0f}Hz, "
@@ -101,7 +331,7 @@ class AudioRecorder:
             sd.wait()
             audio = audio.flatten()
 
-            self._ambient_rms = float(np.sqrt(np.mean(audio.astype(np.float32) ** 2)))
+            self._ambient_rms = _rms(audio)
             self._speech_threshold = max(
                 MIN_SPEECH_THRESHOLD,
                 self._ambient_rms * SPEECH_MULTIPLIER,
@@ -129,29 +359,73 @@ class AudioRecorder:
             logger.warning(f"Calibration failed: {e}. Using config threshold.")
             self._speech_threshold = float(self.silence_threshold)
 
+    def _track_ambient(self, rms: float) -> float:
+        """Fold a quiet chunk into the ambient estimate; return the new speech threshold.
+
+        The estimate is a running minimum that decays upward: a quieter
+        chunk lowers it immediately, a louder one raises it by at most
+        _ambient_rise per chunk. The threshold follows slow changes in
+        room noise instead of staying at the startup calibration.
+        """
+        floor = self._ambient_rms
+        if rms < floor:
+            floor = rms
+        else:
+            floor = min(rms, max(floor, 1.0) * self._ambient_rise)
+        self._ambient_rms = floor
+        self._speech_threshold = max(
+            MIN_SPEECH_THRESHOLD, self._ambient_rms * SPEECH_MULTIPLIER
+        )
+        return self._speech_threshold
+
     def _audio_callback(self, indata, frames, time_info, status):
         """Callback for sounddevice InputStream."""
         if status:
             logger.warning(f"Audio callback status: {status}")
-        self._audio_queue.put(indata.copy())
+        self._ring.put(indata)
 
     # ---- Push-to-talk mode ----
 
+    def _next_record_buffer(self, size: int) -> np.ndarray:
+        """Return the next of two reusable int16 buffers for record().
+
+        Two are kept so one utterance can still be in STT while the next
+        one is being recorded.
+        """
+        self._record_buf_idx ^= 1
+        buf = self._record_bufs[self._record_buf_idx]
+        if buf is None or buf.size < size:
+            buf = np.empty(size, dtype=np.int16)
+            self._record_bufs[self._record_buf_idx] = buf
+        return buf
+
     def record(self) -> Optional[np.ndarray]:
-        """Record audio until silence is detected or max duration reached."""
+        """Record audio until silence is detected or max duration reached.
+
+        The result is a view into a reusable buffer: it stays valid until
+        the second-next record() call.
+        """
         # Auto-calibrate on first use
         if not self._calibrated:
             self.calibrate()
 
         self._is_recording = True
-        self._audio_queue = queue.Queue()
-        chunks = []
+        self._ring.reset()
         silence_chunks = 0
-        chunks_per_second = self.sample_rate / self.chunk_size
-        silence_chunks_threshold = int(self.silence_duration * chunks_per_second)
-        max_chunks = int(self.max_record_seconds * chunks_per_second)
+        silence_chunks_threshold = self._silence_chunks
+        max_chunks = self._max_chunks
         has_speech = False
 
+        # Silence test on the sum of squares: rms < t <=> sum < t^2 * n
+        silence_sq = float(self.silence_threshold) ** 2
+        sq_buf = np.empty(self.chunk_size, dtype=np.int32)
+
+        # Chunks are copied straight into a preallocated buffer, so no
+        # list of chunks or final concatenate/flatten copy is needed
+        # Blocks arrive downmixed to mono (see _ChunkRing)
+        buf = self._next_record_buffer(max_chunks * self.chunk_size)
+        filled = 0
+
         try:
             with sd.InputStream(
                 samplerate=self.sample_rate,
@@ -165,16 +439,14 @@ class AudioRecorder:
 
                 while self._is_recording and chunk_count < max_chunks:
                     try:
-                        chunk = self._audio_queue.get(timeout=0.5)
+                        chunk = self._ring.get(timeout=0.5)
                     except queue.Empty:
                         continue
 
-                    chunks.append(chunk)
+                    filled = self._append_chunk(buf, filled, chunk)
                     chunk_count += 1
 
-                    rms = np.sqrt(np.mean(chunk.astype(np.float32) ** 2))
-
-                    if rms < self.silence_threshold:
+                    if _sum_squares(chunk, sq_buf) < silence_sq * chunk.size:
                         silence_chunks += 1
                     else:
                         silence_chunks = 0
@@ -189,13 +461,13 @@ class AudioRecorder:
         finally:
             self._is_recording = False
 
-        if not chunks or not has_speech:
+        if not filled or not has_speech:
             logger.info("No speech detected.")
             return None
 
-        audio = np.concatenate(chunks, axis=0).flatten()
+        audio = buf[:filled]
         duration = len(audio) / self.sample_rate
-        audio_rms = np.sqrt(np.mean(audio.astype(np.float32) ** 2))
+        audio_rms = _rms(audio)
         logger.info(
             f"Recorded {duration:.1f}s of audio "
             f"(RMS={audio_rms:.0f}, peak={np.max(np.abs(audio)):.0f})"
@@ -213,6 +485,8 @@ class AudioRecorder:
         # Auto-calibrate on first use
         if not self._calibrated:
             self.calibrate()
+        if self._vad_step is None:
+            self._select_vad()
 
         self._on_speech_callback = on_speech
         self._continuous = True
@@ -235,22 +509,16 @@ class AudioRecorder:
 
     def set_cooldown(self, seconds: float = POST_SPEECH_COOLDOWN):
         """Set a cooldown period to prevent hearing own TTS output."""
-        self._cooldown_until = time.monotonic() + seconds
+        self._cooldown_chunks = int(seconds * self._chunks_per_second)
 
     def _continuous_loop(self):
         """Background loop: always-on microphone → detect speech → callback."""
-        audio_q = queue.Queue()
+        audio_q = _ChunkRing(self.chunk_size, self.channels)
 
         def callback(indata, frames, time_info, status):
             if status:
                 logger.warning(f"Continuous audio status: {status}")
-            audio_q.put(indata.copy())
-
-        chunks_per_second = self.sample_rate / self.chunk_size
-        silence_threshold_chunks = int(self.silence_duration * chunks_per_second)
-        min_speech_chunks = int(MIN_SPEECH_DURATION * chunks_per_second)
-        max_chunks = int(self.max_record_seconds * chunks_per_second)
-        pre_buffer_size = max(1, int(PRE_BUFFER_DURATION * chunks_per_second))
+            audio_q.put(indata)
 
         try:
             with sd.InputStream(
@@ -262,11 +530,7 @@ class AudioRecorder:
             ):
                 logger.info("Continuous listener: microphone open, waiting for speech...")
                 while self._continuous:
-                    self._wait_for_speech(
-                        audio_q, chunks_per_second,
-                        silence_threshold_chunks, min_speech_chunks,
-                        max_chunks, pre_buffer_size,
-                    )
+                    self._wait_for_speech(audio_q)
 
         except sd.PortAudioError as e:
             logger.error(f"Continuous listener mic error: {e}")
@@ -275,20 +539,39 @@ class AudioRecorder:
         finally:
             logger.info("Continuous listener exited.")
 
-    def _wait_for_speech(self, audio_q, chunks_per_second,
-                         silence_threshold_chunks, min_speech_chunks,
-                         max_chunks, pre_buffer_size):
+    @staticmethod
+    def _append_chunk(buf: np.ndarray, filled: int, chunk: np.ndarray) -> int:
+        """Copy chunk's samples into buf at filled; return the new fill level."""
+        samples = chunk.reshape(-1)[:buf.size - filled]
+        buf[filled:filled + samples.size] = samples
+        return filled + samples.size
+
+    def _wait_for_speech(self, audio_q):
         """Wait for speech, record it (with pre-buffer), then trigger callback."""
-        chunks = []
+        silence_threshold_chunks = self._silence_chunks
+        min_speech_chunks = self._min_speech_chunks
+        max_chunks = self._max_chunks
+        pre_buffer_size = self._pre_buffer_size
+        buf = None
+        filled = 0
+        chunk_count = 0
         silence_count = 0
         speech_count = 0
         recording = False
 
-        # Use calibrated speech threshold for continuous detection
+        # Start from the calibrated threshold; quiet chunks keep adapting it
         speech_threshold = self._speech_threshold
+        vad_step = self._vad_step
+        if self._vad_takes_sq_buf:
+            # Python steps square each chunk into one reused scratch array
+            vad_step = functools.partial(
+                vad_step, sq_buf=np.empty(self.chunk_size, dtype=np.int32)
+            )
 
-        # Pre-buffer: keep the last N chunks of audio before speech starts
-        pre_buffer = collections.deque(maxlen=pre_buffer_size)
+        # Pre-buffer: the last N chunks before speech starts, kept in a
+        # fixed ring of blocks (ring slots from audio_q get reused)
+        pre_ring, pre_lens = self._pre_ring, self._pre_lens
+        pre_idx = 0
 
         while self._continuous:
             try:
@@ -297,42 +580,56 @@ class AudioRecorder:
                 continue
 
             # Check cooldown (ignore audio right after TTS playback)
-            if time.monotonic() < self._cooldown_until:
-                pre_buffer.clear()
+            if self._cooldown_chunks > 0:
+                self._cooldown_chunks -= 1
+                pre_idx = 0
                 continue
 
-            rms = np.sqrt(np.mean(chunk.astype(np.float32) ** 2))
+            was_recording = recording
+            rms, recording, silence_count, speech_count = vad_step(
+                chunk.reshape(-1), speech_threshold,
+                recording, silence_count, speech_count,
+            )
+
+            if not was_recording:
+                if not recording:
+                    speech_threshold = self._track_ambient(rms)
 
-            if not recording:
                 # Waiting for speech to start — keep pre-buffer rolling
-                pre_buffer.append(chunk)
-
-                if rms >= speech_threshold:
-                    recording = True
+                slot = pre_idx % pre_buffer_size
+                n = min(len(chunk), pre_ring.shape[1])
+                pre_ring[slot, :n] = chunk[:n]
+                pre_lens[slot] = n
+                pre_idx += 1
+
+                if recording:
+                    # One buffer per utterance, filled in place; the callback
+                    # receives a view of it, so it can't be reused for the
+                    # next utterance while that one may still be queued
+                    buf = np.empty(
+                        (max_chunks + pre_buffer_size) * self.chunk_size,
+                        dtype=np.int16,
+                    )
                     # Include pre-buffer audio so word beginnings aren't cut off
-                    chunks = list(pre_buffer)
-                    speech_count = 1
-                    silence_count = 0
+                    for i in range(max(0, pre_idx - pre_buffer_size), pre_idx):
+                        slot = i % pre_buffer_size
+                        filled = self._append_chunk(buf, filled, pre_ring[slot, :pre_lens[slot]])
+                    chunk_count = min(pre_idx, pre_buffer_size)
                     logger.debug(
-                        f"Speech detected (RMS={rms:.0f} >= {speech_threshold:.0f}), "
-                        f"pre-buffer: {len(chunks)} chunks"
+                        f"Speech detected (RMS={rms:.0f}, threshold={speech_threshold:.0f}), "
+                        f"pre-buffer: {chunk_count} chunks"
                     )
             else:
                 # Currently recording speech
-                chunks.append(chunk)
-
-                if rms >= speech_threshold:
-                    silence_count = 0
-                    speech_count += 1
-                else:
-                    silence_count += 1
+                filled = self._append_chunk(buf, filled, chunk)
+                chunk_count += 1
 
                 # Stop conditions
                 if silence_count >= silence_threshold_chunks:
                     if speech_count >= min_speech_chunks:
-                        audio = np.concatenate(chunks, axis=0).flatten()
+                        audio = buf[:filled]
                         duration = len(audio) / self.sample_rate
-                        audio_rms = np.sqrt(np.mean(audio.astype(np.float32) ** 2))
+                        audio_rms = _rms(audio)
                         logger.info(
                             f"Speech ended ({duration:.1f}s, {speech_count} chunks, "
                             f"RMS={audio_rms:.0f})"
@@ -348,8 +645,8 @@ class AudioRecorder:
                         )
                     return
 
-                if len(chunks) >= max_chunks:
-                    audio = np.concatenate(chunks, axis=0).flatten()
+                if chunk_count >= max_chunks:
+                    audio = buf[:filled]
                     logger.info(
                         f"Max recording duration reached ({self.max_record_seconds}s)"
                     )
@@ -365,14 +662,16 @@ class AudioRecorder:
         self._is_recording = False
         self._continuous = False
 
-    def list_devices(self) -> list:
-        """List available audio input devices."""
-        devices = sd.query_devices()
-        return [
-            {"index": i, "name": d["name"], "channels": d["max_input_channels"]}
-            for i, d in enumerate(devices)
-            if d["max_input_channels"] > 0
-        ]
+    def list_devices(self, refresh: bool = False) -> list:
+        """List available audio input devices (cached; refresh=True re-queries)."""
+        global _input_devices
+        if _input_devices is None or refresh:
+            _input_devices = [
+                {"index": i, "name": d["name"], "channels": d["max_input_channels"]}
+                for i, d in enumerate(sd.query_devices())
+                if d["max_input_channels"] > 0
+            ]
+        return list(_input_devices)
 
     def cleanup(self):
         """Release resources."""
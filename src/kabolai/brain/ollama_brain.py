@@ -1,10 +1,12 @@
 """Ollama-based brain engine for intent parsing."""
 
+import functools
 import json
 import logging
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from kabolai.brain.base import BrainEngine
 from kabolai.brain.models import BrainResponse, ParsedCommand
@@ -13,6 +15,119 @@ from kabolai.actions.registry import registry
 
 logger = logging.getLogger(__name__)
 
+try:
+    # Optional: native JSON encode/decode for request bodies and stream lines
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    _loads = json.loads
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Structured-output schema sent as Ollama's "format"; fixed per process
+_SCHEMA = BrainResponse.model_json_schema()
+
+
+# Streamed replies longer than this are treated as a runaway generation
+MAX_RESPONSE_CHARS = 16384
+
+# Only the most recent history messages are sent, keeping the prompt bounded
+MAX_HISTORY_MESSAGES = 12
+
+
+class _JsonObjectEnd:
+    """Tracks streamed text to find where the top-level JSON object closes."""
+
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, text: str) -> int:
+        """Consume more text.
+
+        Returns the offset in text just past the brace that closes the
+        outermost object, or -1 if it hasn't closed yet.
+        """
+        for i, ch in enumerate(text):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == "\\":
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = True
+            elif ch == "{":
+                self.depth += 1
+                self.started = True
+            elif ch == "}":
+                self.depth -= 1
+                if self.started and self.depth == 0:
+                    return i + 1
+        return -1
+
+
+def _read_streamed_content(response) -> str:
+    """Join streamed chat chunks up to the end of the JSON reply.
+
+    Reading stops at the closing brace, so a model that keeps generating
+    after a complete reply (e.g. runaway newlines under ``format``) is
+    never waited on; the caller closes the response, which drops the
+    half-read connection instead of returning it to the pool.
+    """
+    parts = []
+    size = 0
+    end = _JsonObjectEnd()
+    for line in response.iter_lines():
+        if not line:
+            continue
+        chunk = _loads(line)
+        piece = chunk.get("message", {}).get("content", "")
+        stop = end.feed(piece)
+        if stop >= 0:
+            parts.append(piece[:stop])
+            break
+        size += len(piece)
+        if size > MAX_RESPONSE_CHARS:
+            raise ValueError(f"Ollama reply exceeded {MAX_RESPONSE_CHARS} characters")
+        parts.append(piece)
+    return "".join(parts)
+
+
+@functools.lru_cache(maxsize=4)
+def _system_prompt(language: str, actions_schema: str) -> str:
+    """System prompt for a language and action list, built once per pair."""
+    return build_system_prompt(language, actions_schema)
+
+
+@functools.lru_cache(maxsize=4)
+def _body_prefix(model: str, temperature: float) -> bytes:
+    """Serialized request fields that don't change between turns.
+
+    Ends with the "messages" key, so a body is this prefix, the encoded
+    message list and a closing brace; the schema is encoded only once.
+    """
+    static = _dumps({
+        "model": model,
+        "stream": True,
+        "format": _SCHEMA,
+        "options": {
+            "temperature": temperature,
+        },
+    })
+    return static[:-1] + b',"messages":'
+
 
 class OllamaBrain(BrainEngine):
     """Brain that uses Ollama local LLM for intent parsing."""
@@ -28,6 +143,11 @@ class OllamaBrain(BrainEngine):
         self.model = model
         self.temperature = temperature
         self.timeout = timeout
+        # One keep-alive connection to Ollama reused across turns
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     def process(
         self,
@@ -36,31 +156,31 @@ class OllamaBrain(BrainEngine):
         conversation_history: Optional[list[dict]] = None,
     ) -> BrainResponse:
         """Parse user text into a structured command via Ollama."""
-        actions_schema = registry.get_schema_for_llm(language)
-        system_prompt = build_system_prompt(language, actions_schema)
+        # The registry caches its schema text until actions change, so
+        # this only rebuilds the prompt after a new registration
+        system_prompt = _system_prompt(language, registry.get_schema_for_llm(language))
 
+        # The system message is the same string every turn, so Ollama can
+        # reuse its cached prefix; per-turn data only goes after it
         messages = [{"role": "system", "content": system_prompt}]
         if conversation_history:
-            messages.extend(conversation_history)
+            messages.extend(conversation_history[-MAX_HISTORY_MESSAGES:])
         messages.append({"role": "user", "content": user_text})
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/api/chat",
-                json={
-                    "model": self.model,
-                    "messages": messages,
-                    "stream": False,
-                    "format": BrainResponse.model_json_schema(),
-                    "options": {
-                        "temperature": self.temperature,
-                    },
-                },
+                data=(_body_prefix(self.model, self.temperature)
+                      + _dumps(messages) + b"}"),
+                headers=_JSON_HEADERS,
                 timeout=self.timeout,
+                stream=True,
             )
-            response.raise_for_status()
-            data = response.json()
-            content = data["message"]["content"]
+            try:
+                response.raise_for_status()
+                content = _read_streamed_content(response)
+            finally:
+                response.close()
 
             return BrainResponse.model_validate_json(content)
 
@@ -94,7 +214,7 @@ class OllamaBrain(BrainEngine):
     def is_available(self) -> bool:
         """Check if Ollama is running and the model is available."""
         try:
-            r = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            r = self._session.get(f"{self.base_url}/api/tags", timeout=5)
             if r.status_code != 200:
                 return False
             tags = r.json()
@@ -106,4 +226,4 @@ class OllamaBrain(BrainEngine):
             return False
 
     def cleanup(self) -> None:
-        pass
+        self._session.close()
@@ -0,0 +1,31 @@
+"""Environment checks shared by the setup and test commands.
+
+Each check imports its own dependency, so checking Ollama never loads
+PortAudio and checking audio never loads requests.
+"""
+
+import functools
+from typing import Optional
+
+OLLAMA_TAGS_URL = "http://localhost:11434/api/tags"
+
+
+def ollama_models() -> Optional[list]:
+    """Names of the models a local Ollama server has pulled.
+
+    Returns None if Ollama answers with an error; raises if unreachable.
+    """
+    import requests
+
+    r = requests.get(OLLAMA_TAGS_URL, timeout=5)
+    if r.status_code != 200:
+        return None
+    return [m["name"] for m in r.json().get("models", [])]
+
+
+@functools.lru_cache(maxsize=1)
+def query_devices() -> tuple:
+    """All sounddevice devices, queried once per process."""
+    import sounddevice as sd
+
+    return tuple(sd.query_devices())
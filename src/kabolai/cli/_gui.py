@@ -0,0 +1,16 @@
+"""CLI "gui" command."""
+
+import click
+
+
+@click.command()
+@click.option("--profile", "-p", default=None,
+              type=click.Choice(["cpu", "gpu_light", "gpu_full"]),
+              help="Hardware profile")
+@click.option("--language", "-l", default=None,
+              type=click.Choice(["en", "uk"]),
+              help="Starting language")
+def gui(profile, language):
+    """Launch the GUI application."""
+    from kabolai.gui.app import main as gui_main
+    gui_main(profile=profile, language=language)
@@ -0,0 +1,145 @@
+"""CLI "run" command: the hotkey/tray voice assistant."""
+
+import logging
+import sys
+import threading
+
+import click
+
+from kabolai import __version__
+
+logger = logging.getLogger(__name__)
+
+
+@click.command()
+@click.option("--profile", "-p", default=None,
+              type=click.Choice(["cpu", "gpu_light", "gpu_full"]),
+              help="Hardware profile")
+@click.option("--language", "-l", default=None,
+              type=click.Choice(["en", "uk"]),
+              help="Starting language")
+@click.option("--config", "-c", default=None,
+              help="Path to custom config YAML")
+@click.option("--no-tray", is_flag=True, help="Disable system tray icon")
+def run(profile, language, config, no_tray):
+    """Start the voice assistant."""
+    from kabolai.core.config import AppConfig
+    from kabolai.core.logging import setup_logging
+
+    # Load config
+    try:
+        app_config = AppConfig.load(config_path=config, profile=profile)
+        if language:
+            app_config.language = language
+    except Exception as e:
+        click.echo(f"Error loading config: {e}", err=True)
+        sys.exit(1)
+
+    # Setup logging
+    log_cfg = app_config.logging
+    setup_logging(
+        level=log_cfg.get("level", "INFO"),
+        log_file=log_cfg.get("file", "kabolai.log"),
+    )
+
+    click.echo(f"KA-BOL-AI v{__version__}")
+    click.echo(f"Profile: {app_config.profile}")
+    click.echo(f"Language: {app_config.language}")
+    click.echo(f"STT: {app_config.stt.get('engine', 'vosk')}")
+    click.echo(f"LLM: {app_config.brain.get('ollama', {}).get('model', 'qwen2.5:1.5b')}")
+    click.echo()
+
+    # Initialize assistant
+    from kabolai.assistant import Assistant
+
+    try:
+        assistant = Assistant(app_config)
+    except Exception as e:
+        logger.error(f"Failed to initialize assistant: {e}", exc_info=True)
+        click.echo(f"Initialization error: {e}", err=True)
+        sys.exit(1)
+
+    # Check brain availability
+    if not assistant.check_brain():
+        click.echo(
+            "WARNING: Ollama is not reachable or the model is not loaded.\n"
+            "Make sure Ollama is running: ollama serve\n"
+            f"And the model is pulled: ollama pull {app_config.brain.get('ollama', {}).get('model', 'qwen2.5:1.5b')}",
+            err=True,
+        )
+
+    # Setup UI
+    from kabolai.ui.hotkeys import HotkeyManager
+    hotkey_mgr = HotkeyManager(app_config.hotkeys)
+
+    tray = None
+    if not no_tray:
+        from kabolai.ui.tray import SystemTray
+        tray = SystemTray(
+            state=assistant.state,
+            on_toggle=lambda: _toggle_active(assistant, tray),
+            on_language=lambda: _toggle_language(assistant, tray),
+            on_quit=lambda: _quit(assistant, hotkey_mgr, tray),
+        )
+        tray.run_in_background()
+
+    # Bind hotkeys — using the new self-healing handle_voice()
+    def on_push_to_talk():
+        if not assistant.state.is_active:
+            return
+        # handle_voice() has its own pipeline lock — no need to check
+        # is_listening/is_processing here. If already busy, it returns
+        # immediately. If stuck, the watchdog auto-resets.
+        threading.Thread(
+            target=assistant.handle_voice, daemon=True
+        ).start()
+
+    hotkey_mgr.bind(
+        on_push_to_talk=on_push_to_talk,
+        on_toggle_active=lambda: _toggle_active(assistant, tray),
+        on_toggle_language=lambda: _toggle_language(assistant, tray),
+        on_quit=lambda: _quit(assistant, hotkey_mgr, tray),
+    )
+
+    click.echo("Ready! Hotkeys:")
+    click.echo(f"  {app_config.hotkeys.push_to_talk} = Push to talk")
+    click.echo(f"  {app_config.hotkeys.toggle_active} = Toggle on/off")
+    click.echo(f"  {app_config.hotkeys.toggle_language} = Switch EN/UK")
+    click.echo(f"  {app_config.hotkeys.quit} = Quit")
+    click.echo()
+
+    # Sleep until shutdown; the timeout only lets Ctrl+C through on
+    # Windows, where an untimed wait can't be interrupted
+    try:
+        while not assistant.state.wait_for_shutdown(1.0):
+            pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        _quit(assistant, hotkey_mgr, tray)
+
+
+def _toggle_active(assistant, tray=None):
+    new_state = assistant.state.toggle_active()
+    status = "ACTIVE" if new_state else "INACTIVE"
+    click.echo(f"[{status}]")
+    if new_state:
+        # Force-reset pipeline state when reactivating
+        assistant.state.force_reset()
+    if tray:
+        tray.update_icon()
+
+
+def _toggle_language(assistant, tray=None):
+    new_lang = assistant.state.toggle_language()
+    click.echo(f"[Language: {new_lang.upper()}]")
+    if tray:
+        tray.update_icon()
+
+
+def _quit(assistant, hotkey_mgr, tray=None):
+    click.echo("Shutting down...")
+    hotkey_mgr.unbind_all()
+    if tray:
+        tray.stop()
+    assistant.shutdown()
@@ -0,0 +1,44 @@
+"""CLI "setup" command: check Ollama and audio devices."""
+
+import click
+
+from kabolai.cli._checks import ollama_models, query_devices
+
+
+@click.command()
+@click.option("--profile", "-p", default="cpu",
+              type=click.Choice(["cpu", "gpu_light", "gpu_full"]),
+              help="Hardware profile to download models for")
+@click.option("--skip-ollama", is_flag=True, help="Don't check the Ollama server")
+@click.option("--skip-audio", is_flag=True, help="Don't check audio devices")
+def setup(profile, skip_ollama, skip_audio):
+    """Download models and verify setup."""
+    click.echo(f"Setting up KA-BOL-AI for profile: {profile}")
+
+    # Check Ollama
+    if not skip_ollama:
+        click.echo("\nChecking Ollama...")
+        try:
+            models = ollama_models()
+            if models is not None:
+                click.echo(f"  Ollama is running. Models: {', '.join(models) or 'none'}")
+            else:
+                click.echo("  Ollama responded but with an error.")
+        except Exception:
+            click.echo("  Ollama is NOT running. Start it with: ollama serve")
+
+    # Check audio devices
+    if not skip_audio:
+        click.echo("\nChecking audio devices...")
+        try:
+            inputs = [d for d in query_devices() if d["max_input_channels"] > 0]
+            click.echo(f"  Found {len(inputs)} input device(s):")
+            for d in inputs[:5]:
+                click.echo(f"    - {d['name']}")
+        except Exception as e:
+            click.echo(f"  Audio error: {e}")
+
+    click.echo(f"\nTo download VOSK models, run:")
+    click.echo(f"  python scripts/download_models.py --profile {profile}")
+    click.echo(f"\nTo pull Ollama model, run:")
+    click.echo(f"  python scripts/setup_ollama.py --profile {profile}")
@@ -0,0 +1,88 @@
+"""CLI "test" commands: quick checks of the components.
+
+"test" runs every check; test-registry, test-audio and test-ollama run
+one each and import only what that check needs.
+"""
+
+import click
+
+from kabolai.cli._checks import ollama_models, query_devices
+
+
+def _check_imports():
+    click.echo("Testing imports...")
+    try:
+        from kabolai.core.config import AppConfig  # noqa
+        from kabolai.core.state import AssistantState  # noqa
+        from kabolai.actions.registry import registry  # noqa
+        from kabolai.brain.models import BrainResponse  # noqa
+        click.echo("   OK: All core imports work")
+    except ImportError as e:
+        click.echo(f"   FAIL: {e}")
+
+
+def _check_registry():
+    click.echo("Testing action registry...")
+    from kabolai.actions.registry import registry
+    import kabolai.actions.apps  # noqa
+    import kabolai.actions.system  # noqa
+    import kabolai.actions.web  # noqa
+    import kabolai.actions.media  # noqa
+    import kabolai.actions.conversation  # noqa
+    actions = registry.list_actions()
+    click.echo(f"   OK: {len(actions)} actions registered")
+    for a in actions:
+        click.echo(f"     - {a.name} ({a.category})")
+
+
+def _check_audio():
+    click.echo("Testing audio...")
+    try:
+        devices = query_devices()
+        click.echo(f"   OK: sounddevice works ({len(devices)} devices)")
+    except Exception as e:
+        click.echo(f"   FAIL: {e}")
+
+
+def _check_ollama():
+    click.echo("Testing Ollama connection...")
+    try:
+        models = ollama_models()
+        if models is None:
+            raise RuntimeError("error response")
+        click.echo(f"   OK: Ollama running, models: {', '.join(models) or 'none'}")
+    except Exception:
+        click.echo("   WARN: Ollama not reachable")
+
+
+@click.command()
+def test():
+    """Quick test of all components."""
+    click.echo("Testing KA-BOL-AI components...\n")
+
+    checks = (_check_imports, _check_registry, _check_audio, _check_ollama)
+    for i, check in enumerate(checks, 1):
+        if i > 1:
+            click.echo()
+        click.echo(f"{i}. ", nl=False)
+        check()
+
+    click.echo("\nDone!")
+
+
+@click.command("test-registry")
+def test_registry():
+    """Check that all actions register."""
+    _check_registry()
+
+
+@click.command("test-audio")
+def test_audio():
+    """Check that audio devices can be listed."""
+    _check_audio()
+
+
+@click.command("test-ollama")
+def test_ollama():
+    """Check the connection to Ollama."""
+    _check_ollama()
@@ -2,27 +2,74 @@
 
 from __future__ import annotations
 
+import copy
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
 
-import yaml
-
 from kabolai.core.constants import CONFIG_DIR
 from kabolai.core.exceptions import ConfigError
 
+DEFAULT_CONFIG_PATH = CONFIG_DIR / "default.yaml"
+PROFILES_DIR = CONFIG_DIR / "profiles"
+
+# Parsed YAML files by path, with the (mtime_ns, size) they were read at
+_YAML_CACHE: OrderedDict[str, tuple[int, int, dict]] = OrderedDict()
+_YAML_CACHE_SIZE = 16
+_yaml_lock = threading.Lock()
+
 
 def deep_merge(base: dict, override: dict) -> dict:
-    """Recursively merge override into base."""
+    """Merge override into base, descending into nested dicts.
+
+    Walks the override with an explicit stack rather than recursion.
+    Neither argument is modified: only the dicts along keys that override
+    touches are copied, and untouched subtrees are shared with base.
+    """
     result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
+    stack = [(result, override)]
+    while stack:
+        target, changes = stack.pop()
+        for key, value in changes.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                target[key] = current = current.copy()
+                stack.append((current, value))
+            else:
+                target[key] = value
     return result
 
 
+def _read_yaml(path: Path) -> dict:
+    """Parse a YAML file, reusing the cached result while it is unchanged.
+
+    Returns a deep copy, so callers are free to modify it.
+    """
+    st = path.stat()
+    key = str(path)
+    with _yaml_lock:
+        cached = _YAML_CACHE.get(key)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            _YAML_CACHE.move_to_end(key)
+            return copy.deepcopy(cached[2])
+
+    # Imported here so using the dataclasses doesn't pay for PyYAML
+    import yaml
+
+    # libyaml's C parser when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    # The loader decodes UTF-8 bytes itself; no text-mode file needed
+    data = yaml.load(path.read_bytes(), Loader=loader) or {}
+    with _yaml_lock:
+        _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+        _YAML_CACHE.move_to_end(key)
+        while len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+            _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(data)
+
+
 @dataclass
 class AudioConfig:
     sample_rate: int = 16000
@@ -31,6 +78,7 @@ class AudioConfig:
     silence_threshold: int = 500
     silence_duration: float = 0.8
     max_record_seconds: int = 30
+    vad: str = "auto"
 
 
 @dataclass
@@ -59,28 +107,29 @@ class AppConfig:
         profile: Optional[str] = None,
     ) -> "AppConfig":
         """Load config from YAML, apply profile overlay."""
-        default_path = CONFIG_DIR / "default.yaml"
-        if not default_path.exists():
-            raise ConfigError(f"Default config not found: {default_path}")
-
-        with open(default_path, "r", encoding="utf-8") as f:
-            config_data = yaml.safe_load(f) or {}
+        # _read_yaml stats each file anyway, so a missing file is caught
+        # from that rather than with a separate exists() check
+        try:
+            config_data = _read_yaml(DEFAULT_CONFIG_PATH)
+        except FileNotFoundError:
+            raise ConfigError(f"Default config not found: {DEFAULT_CONFIG_PATH}") from None
 
         # Apply profile overlay
         profile_name = profile or config_data.get("profile", "cpu")
-        profile_path = CONFIG_DIR / "profiles" / f"{profile_name}.yaml"
-        if profile_path.exists():
-            with open(profile_path, "r", encoding="utf-8") as f:
-                profile_data = yaml.safe_load(f) or {}
+        try:
+            profile_data = _read_yaml(PROFILES_DIR / f"{profile_name}.yaml")
+        except FileNotFoundError:
+            pass
+        else:
             config_data = deep_merge(config_data, profile_data)
 
         # Apply user override
         if config_path:
             user_path = Path(config_path)
-            if not user_path.exists():
-                raise ConfigError(f"User config not found: {user_path}")
-            with open(user_path, "r", encoding="utf-8") as f:
-                user_data = yaml.safe_load(f) or {}
+            try:
+                user_data = _read_yaml(user_path)
+            except FileNotFoundError:
+                raise ConfigError(f"User config not found: {user_path}") from None
             config_data = deep_merge(config_data, user_data)
 
         return cls._from_dict(config_data)
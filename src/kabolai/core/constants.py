@@ -1,6 +1,7 @@
 """Constants for KA-BOL-AI."""
 
 import sys
+from enum import IntEnum
 from pathlib import Path
 
 # Project root — handles both normal and PyInstaller frozen mode
@@ -20,6 +21,16 @@ LOGS_DIR = PROJECT_ROOT / "logs"
 SUPPORTED_LANGUAGES = ("en", "uk")
 DEFAULT_LANGUAGE = "en"
 
+
+class Lang(IntEnum):
+    """Index into per-language lookup tables (see LANG_CODES)."""
+    UK = 0
+    EN = 1
+
+
+LANG_CODES = ("uk", "en")
+LANG_BY_CODE = {code: Lang(i) for i, code in enumerate(LANG_CODES)}
+
 # VOSK model download info (flat lookup by key)
 VOSK_MODELS = {
     "en_small": {
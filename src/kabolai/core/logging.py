@@ -7,6 +7,9 @@ from pathlib import Path
 
 from kabolai.core.constants import LOGS_DIR
 
+# Set once LOGS_DIR has been created, so later calls skip the mkdir
+_logs_dir_ready = False
+
 
 def setup_logging(
     level: str = "INFO",
@@ -15,14 +18,19 @@ def setup_logging(
     backup_count: int = 3,
 ) -> logging.Logger:
     """Configure logging with console and file handlers."""
-    LOGS_DIR.mkdir(parents=True, exist_ok=True)
+    global _logs_dir_ready
+    if not _logs_dir_ready:
+        LOGS_DIR.mkdir(parents=True, exist_ok=True)
+        _logs_dir_ready = True
     log_path = LOGS_DIR / log_file
 
     root_logger = logging.getLogger("kabolai")
     root_logger.setLevel(getattr(logging, level.upper(), logging.INFO))
 
-    # Clear existing handlers
-    root_logger.handlers.clear()
+    # Clear existing handlers, closing any log file they hold open
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+        handler.close()
 
     formatter = logging.Formatter(
         "%(asctime)s [%(levelname)-7s] %(name)s: %(message)s",
@@ -34,12 +42,13 @@ def setup_logging(
     console.setFormatter(formatter)
     root_logger.addHandler(console)
 
-    # File handler
+    # File handler; the file is only opened once something is logged
     file_handler = RotatingFileHandler(
         log_path,
         maxBytes=max_bytes,
         backupCount=backup_count,
         encoding="utf-8",
+        delay=True,
     )
     file_handler.setFormatter(formatter)
     root_logger.addHandler(file_handler)
@@ -3,16 +3,23 @@
 import logging
 import threading
 import time
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 # Maximum seconds any single pipeline run can take before auto-reset
 PIPELINE_TIMEOUT = 20
+PIPELINE_TIMEOUT_NS = PIPELINE_TIMEOUT * 1_000_000_000
 
 
 class AssistantState:
     """Mutable state shared across threads with automatic hang recovery."""
 
+    __slots__ = (
+        "language", "is_active", "is_listening", "is_processing", "is_speaking",
+        "is_running", "_lock", "_pipeline_start", "_voice_lock", "_stopped",
+    )
+
     def __init__(self, language: str = "en"):
         self.language = language
         self.is_active = True
@@ -21,10 +28,12 @@ class AssistantState:
         self.is_speaking = False
         self.is_running = True
         self._lock = threading.Lock()
-        # Timestamp when pipeline started (for watchdog)
-        self._pipeline_start: float = 0.0
+        # time.monotonic_ns() when the pipeline started, 0 if idle (for watchdog)
+        self._pipeline_start: int = 0
         # Voice pipeline lock — prevents overlapping voice commands
         self._voice_lock = threading.Lock()
+        # Set by shutdown(), for threads waiting on it
+        self._stopped = threading.Event()
 
     @property
     def is_busy(self) -> bool:
@@ -39,11 +48,12 @@ class AssistantState:
         long, forcefully reset it and allow the new command through.
         """
         # Self-healing: check if previous pipeline is stuck
-        if self._pipeline_start > 0:
-            elapsed = time.monotonic() - self._pipeline_start
-            if elapsed > PIPELINE_TIMEOUT:
+        started = self._pipeline_start
+        if started:
+            elapsed = time.monotonic_ns() - started
+            if elapsed > PIPELINE_TIMEOUT_NS:
                 logger.warning(
-                    f"Pipeline stuck for {elapsed:.0f}s — "
+                    f"Pipeline stuck for {elapsed / 1e9:.0f}s — "
                     f"auto-resetting (self-healing)"
                 )
                 self.force_reset()
@@ -57,17 +67,29 @@ class AssistantState:
         acquired = self._voice_lock.acquire(blocking=False)
         if acquired:
             with self._lock:
-                self._pipeline_start = time.monotonic()
+                self._pipeline_start = time.monotonic_ns()
             return True
         return False
 
+    def renew_pipeline(self):
+        """Clear busy flags and restart the watchdog clock, keeping the lock.
+
+        Used when the owner of the pipeline moves straight on to the next
+        utterance without releasing it.
+        """
+        with self._lock:
+            self.is_listening = False
+            self.is_processing = False
+            self.is_speaking = False
+            self._pipeline_start = time.monotonic_ns()
+
     def end_pipeline(self):
         """Mark the voice pipeline as complete and release the lock."""
         with self._lock:
             self.is_listening = False
             self.is_processing = False
             self.is_speaking = False
-            self._pipeline_start = 0.0
+            self._pipeline_start = 0
         try:
             self._voice_lock.release()
         except RuntimeError:
@@ -79,7 +101,7 @@ class AssistantState:
             self.is_listening = False
             self.is_processing = False
             self.is_speaking = False
-            self._pipeline_start = 0.0
+            self._pipeline_start = 0
         logger.info("State force-reset: all flags cleared.")
 
     def toggle_language(self) -> str:
@@ -98,17 +120,17 @@ class AssistantState:
             self.is_active = not self.is_active
             return self.is_active
 
+    # Single-flag writes are atomic on their own; the lock is only taken
+    # for read-modify-write and multi-field updates. Flag reads are
+    # snapshots and may be stale by the time they are acted on.
     def set_listening(self, value: bool):
-        with self._lock:
-            self.is_listening = value
+        self.is_listening = value
 
     def set_processing(self, value: bool):
-        with self._lock:
-            self.is_processing = value
+        self.is_processing = value
 
     def set_speaking(self, value: bool):
-        with self._lock:
-            self.is_speaking = value
+        self.is_speaking = value
 
     def shutdown(self):
         with self._lock:
@@ -117,4 +139,9 @@ class AssistantState:
             self.is_listening = False
             self.is_processing = False
             self.is_speaking = False
-            self._pipeline_start = 0.0
+            self._pipeline_start = 0
+        self._stopped.set()
+
+    def wait_for_shutdown(self, timeout: Optional[float] = None) -> bool:
+        """Block until shutdown() is called; returns False on timeout."""
+        return self._stopped.wait(timeout)
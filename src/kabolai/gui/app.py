@@ -304,8 +304,10 @@ class KabolaiApp(ctk.CTk):
             self._mic_button.set_state(new_state)
 
         # Drain events
-        for event in self._assistant.drain_events():
+        events = self._assistant.drain_events()
+        for event in events:
             self._handle_event(event)
+        self._assistant.release_events(events)
 
         # Update language toggle
         self._lang_toggle.set_language(self._get_language())
@@ -10,6 +10,7 @@ import tkinter as tk
 
 import customtkinter as ctk
 
+from kabolai.core.constants import Lang
 from kabolai.gui.theme import (
     BG_DARK, BG_PANEL, BG_INPUT,
     TEXT_PRIMARY, TEXT_SECONDARY, TEXT_ACCENT,
@@ -428,20 +429,16 @@ class SettingsDialog(ctk.CTkToplevel):
         if self._config:
             self._config.tts.setdefault("ukrainian", {})["voice"] = new_voice
 
-        # Reload Ukrainian TTS if it was loaded
-        if self._assistant._tts_uk:
-            try:
-                self._assistant._tts_uk.set_voice(new_voice)
-            except Exception as e:
-                logger.error(f"Ukrainian voice change error: {e}")
+        # Applied now if the engine is loaded, otherwise when it loads
+        self._assistant.configure_tts(
+            Lang.UK, lambda tts: tts.set_voice(new_voice)
+        )
 
         # Update English speech rate
         new_rate = int(self._en_rate_var.get())
-        if self._assistant._tts_en:
-            try:
-                self._assistant._tts_en.set_speed(new_rate / 175.0)
-            except Exception as e:
-                logger.error(f"English rate change error: {e}")
+        self._assistant.configure_tts(
+            Lang.EN, lambda tts: tts.set_speed(new_rate / 175.0)
+        )
 
     # ---- Helpers ----
 
@@ -22,7 +22,7 @@ def create_stt_engine(config: AppConfig) -> STTEngine:
         engine = WhisperSTT(
             model_size=whisper_cfg.get("model_size", "base"),
             device=whisper_cfg.get("device", "cuda"),
-            compute_type=whisper_cfg.get("compute_type", "float16"),
+            compute_type=whisper_cfg.get("compute_type", "auto"),
         )
         engine.load_model()
         return engine
@@ -14,6 +14,10 @@ from kabolai.stt.base import STTEngine, TranscriptionResult
 
 logger = logging.getLogger(__name__)
 
+# compute_type used for "auto": int8 weights on both devices, with float16
+# activations on GPU. Roughly a third of the float16 memory footprint.
+DEFAULT_COMPUTE_TYPES = {"cpu": "int8", "cuda": "int8_float16"}
+
 
 class WhisperSTT(STTEngine):
     """faster-whisper GPU speech recognition engine.
@@ -26,7 +30,7 @@ class WhisperSTT(STTEngine):
         self,
         model_size: str = "medium",
         device: str = "cuda",
-        compute_type: str = "float16",
+        compute_type: str = "auto",
     ):
         self._model_size = model_size
         self._device = device
@@ -56,6 +60,8 @@ class WhisperSTT(STTEngine):
                 logger.warning("Cannot check CUDA. Falling back to CPU.")
                 device = "cpu"
                 compute_type = "int8"
+        if compute_type == "auto":
+            compute_type = DEFAULT_COMPUTE_TYPES.get(device, "int8")
 
         logger.info(
             f"Loading Whisper '{self._model_size}' on {device} ({compute_type})... "
@@ -1,7 +1,16 @@
 """Abstract base class for Text-to-Speech engines."""
 
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import Iterator
+
+_SENTENCE_END = re.compile(r"(?<=[.!?…])\s+")
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split text at sentence boundaries for chunked synthesis."""
+    return [s for s in _SENTENCE_END.split(text.strip()) if s]
 
 
 @dataclass
@@ -20,6 +29,13 @@ class TTSEngine(ABC):
         """Convert text to speech audio."""
         ...
 
+    def synthesize_stream(self, text: str) -> Iterator[SpeechResult]:
+        """Yield speech in chunks so playback can start early.
+
+        Engines that cannot stream produce the whole utterance as one chunk.
+        """
+        yield self.synthesize(text)
+
     @abstractmethod
     def get_available_voices(self) -> list[str]:
         """List available voice identifiers."""
@@ -33,6 +49,10 @@ class TTSEngine(ABC):
         """Set speech rate (1.0 = normal). Override if supported."""
         pass
 
+    def warmup(self) -> None:
+        """Load models ahead of the first synthesis. Override if lazy."""
+        pass
+
     def cleanup(self) -> None:
         """Release engine resources."""
         pass
@@ -34,6 +34,7 @@ def create_tts_engine(config: AppConfig, lang: str = "en") -> TTSEngine:
             return PiperTTS(
                 model=piper_cfg.get("model", "en_US-lessac-medium"),
                 model_path=piper_cfg.get("model_path"),
+                quantization=piper_cfg.get("quantization", "auto"),
             )
         except Exception as e:
             logger.warning(f"Piper TTS failed, falling back to pyttsx3: {e}")
@@ -1,9 +1,12 @@
 """Piper TTS engine for English (GPU profile, optional)."""
 
+import importlib
 import logging
+import os
 import subprocess
 import tempfile
 from pathlib import Path
+from typing import Iterator
 
 from kabolai.core.exceptions import TTSError
 from kabolai.tts.base import TTSEngine, SpeechResult
@@ -11,12 +14,78 @@ from kabolai.tts.base import TTSEngine, SpeechResult
 logger = logging.getLogger(__name__)
 
 
+def _has_int8_dot() -> bool:
+    """True if the CPU has int8 dot-product instructions (VNNI / ARM dotprod).
+
+    Uses numpy's runtime CPU feature detection, which works on every
+    platform; /proc/cpuinfo additionally catches AVX-VNNI on Linux, which
+    numpy doesn't report. The feature table is numpy-private, so any
+    failure to read it just means "unknown".
+    """
+    for module in ("numpy._core._multiarray_umath", "numpy.core._multiarray_umath"):
+        try:
+            features = importlib.import_module(module).__cpu_features__
+            if features.get("AVX512VNNI") or features.get("ASIMDDP"):
+                return True
+            break
+        except Exception:
+            continue
+    try:
+        with open("/proc/cpuinfo") as f:
+            return "avx_vnni" in f.read()
+    except OSError:
+        return False
+
+
+def _quantized_model(onnx_file: Path, quantization: str) -> Path:
+    """Return an int8 weight-quantized copy of onnx_file, or onnx_file itself.
+
+    quantization is "int8", "auto" (int8 only on CPUs with VNNI, where it
+    is actually faster) or "none". The quantized model is written next to
+    the original once (via a temporary file renamed into place, so a
+    partial write is never picked up) and reused afterwards. Weights use
+    symmetric QInt8; QUInt8 is known to run slower than fp32 on many CPUs.
+    """
+    if quantization == "none" or (quantization == "auto" and not _has_int8_dot()):
+        return onnx_file
+
+    target = onnx_file.with_name(f"{onnx_file.stem}.int8.onnx")
+    if target.exists():
+        return target
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+    except ImportError:
+        logger.warning("onnxruntime quantization tools missing; using fp32 Piper model.")
+        return onnx_file
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=f"{target.stem}.", suffix=".tmp.onnx", dir=target.parent
+    )
+    os.close(fd)
+    tmp = Path(tmp_name)
+    try:
+        quantize_dynamic(
+            str(onnx_file), str(tmp),
+            op_types_to_quantize=["MatMul"],
+            weight_type=QuantType.QInt8,
+        )
+        os.replace(tmp, target)
+    except Exception as e:
+        logger.warning(f"Piper int8 quantization failed, using fp32 model: {e}")
+        return onnx_file
+    finally:
+        tmp.unlink(missing_ok=True)
+    logger.info(f"Quantized Piper model to int8: {target.name}")
+    return target
+
+
 class PiperTTS(TTSEngine):
     """English TTS using piper-tts (local, fast, GPU-friendly)."""
 
-    def __init__(self, model: str = "en_US-lessac-medium", model_path: str = None):
+    def __init__(self, model: str = "en_US-lessac-medium", model_path: str = None,
+                 quantization: str = "auto"):
         self._model_name = model
         self._model_path = model_path
+        self._quantization = quantization
         self._piper = None
         self._initialize()
 
@@ -28,10 +97,17 @@ class PiperTTS(TTSEngine):
 
             if self._model_path and Path(self._model_path).exists():
                 model_file = Path(self._model_path)
-                onnx_files = list(model_file.glob("*.onnx"))
+                onnx_files = sorted(
+                    f for f in model_file.glob("*.onnx")
+                    if not f.name.endswith(".int8.onnx")
+                )
                 if onnx_files:
-                    self._piper = PiperVoice.load(str(onnx_files[0]))
-                    logger.info(f"Piper TTS loaded: {onnx_files[0].name}")
+                    model = _quantized_model(onnx_files[0], self._quantization)
+                    # The voice config stays next to the original model
+                    self._piper = PiperVoice.load(
+                        str(model), config_path=f"{onnx_files[0]}.json"
+                    )
+                    logger.info(f"Piper TTS loaded: {model.name}")
                     return
 
             logger.warning(
@@ -66,6 +142,23 @@ class PiperTTS(TTSEngine):
         except Exception as e:
             raise TTSError(f"Piper TTS synthesis failed: {e}") from e
 
+    def synthesize_stream(self, text: str) -> Iterator[SpeechResult]:
+        """Yield raw PCM per sentence straight from piper."""
+        if not text.strip():
+            return
+        if self._piper is None:
+            raise TTSError("Piper model not loaded.")
+        if not hasattr(self._piper, "synthesize_stream_raw"):
+            yield self.synthesize(text)
+            return
+
+        sample_rate = self._piper.config.sample_rate
+        try:
+            for pcm in self._piper.synthesize_stream_raw(text):
+                yield SpeechResult(audio_data=pcm, sample_rate=sample_rate, format="raw")
+        except Exception as e:
+            raise TTSError(f"Piper TTS synthesis failed: {e}") from e
+
     def get_available_voices(self) -> list[str]:
         return [self._model_name]
 
@@ -8,10 +8,10 @@ import io
 import logging
 import queue
 import threading
-from typing import Optional
+from typing import Iterator, Optional
 
 from kabolai.core.exceptions import TTSError
-from kabolai.tts.base import TTSEngine, SpeechResult
+from kabolai.tts.base import TTSEngine, SpeechResult, split_sentences
 
 logger = logging.getLogger(__name__)
 
@@ -107,6 +107,9 @@ class UkrainianTTS(TTSEngine):
             )
             return True
 
+    def warmup(self) -> None:
+        self._ensure_initialized()
+
     def synthesize(self, text: str) -> SpeechResult:
         """Synthesize Ukrainian text to WAV audio (with timeout)."""
         if not text.strip():
@@ -154,6 +157,11 @@ class UkrainianTTS(TTSEngine):
         logger.info(f"[Ukrainian TTS] '{text[:40]}' -> {len(data)} bytes")
         return SpeechResult(audio_data=data, sample_rate=22050, format="wav")
 
+    def synthesize_stream(self, text: str) -> Iterator[SpeechResult]:
+        """Synthesize sentence by sentence; the first is ready much sooner."""
+        for sentence in split_sentences(text):
+            yield self.synthesize(sentence)
+
     def get_available_voices(self) -> list[str]:
         if self._voices_enum:
             return [v.name for v in self._voices_enum]
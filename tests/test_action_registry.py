@@ -51,6 +51,21 @@ class TestActionRegistry:
         assert result.success is True
         assert "42" in result.message
 
+    def test_execute_missing_required_param(self):
+        @registry.register(
+            name="required_test",
+            category="test",
+            description_en="Required test",
+            description_uk="Тест",
+            parameters=[{"name": "x", "type": "int", "required": True}],
+        )
+        def required_test(x: int):
+            return ActionResult(success=True, message=f"got {x}")
+
+        result = registry.execute("required_test", {})
+        assert result.success is False
+        assert "x" in result.message
+
     def test_execute_unknown_action(self):
         result = registry.execute("nonexistent_action_xyz", {})
         assert result.success is False
@@ -59,6 +74,38 @@ class TestActionRegistry:
         actions = registry.list_actions()
         assert isinstance(actions, list)
 
+    def test_listings_are_copies(self):
+        count = len(registry.list_actions())
+        registry.list_actions().clear()
+        registry.actions_by_category().clear()
+        for metas in registry.actions_by_category().values():
+            metas.clear()
+        assert len(registry.list_actions()) == count
+        assert sum(len(m) for m in registry.actions_by_category().values()) == count
+
+    def test_list_actions_by_category_skips_aliases(self):
+        @registry.register(
+            name="category_test",
+            category="category_test_cat",
+            description_en="Category test",
+            description_uk="Тест категорії",
+            aliases=["category_alias"],
+        )
+        def category_test():
+            return ActionResult(success=True, message="ok")
+
+        # Re-registering replaces the previous entry instead of duplicating it
+        registry.register(
+            name="category_test",
+            category="category_test_cat",
+            description_en="Category test",
+            description_uk="Тест категорії",
+        )(category_test)
+
+        names = [a.name for a in registry.list_actions("category_test_cat")]
+        assert names == ["category_test"]
+        assert [a.name for a in registry.list_actions()].count("category_test") == 1
+
     def test_get_schema_for_llm(self):
         # Import real actions to populate registry
         import kabolai.actions.apps  # noqa
@@ -76,3 +123,20 @@ class TestActionRegistry:
         assert "open_app" in schema
         # Ukrainian description should be present
         assert "Відкрити" in schema
+
+    def test_schema_cache_invalidated_on_register(self):
+        first = registry.get_schema_for_llm("en")
+        assert registry.get_schema_for_llm("en") is first
+
+        @registry.register(
+            name="schema_cache_test",
+            category="test",
+            description_en="Schema cache test",
+            description_uk="Тест кешу",
+            parameters=[{"name": "n", "type": "int", "required": True}],
+        )
+        def schema_cache_test(n: int):
+            return ActionResult(success=True, message="ok")
+
+        schema = registry.get_schema_for_llm("en")
+        assert "- schema_cache_test(n: int (required)): Schema cache test" in schema
@@ -39,6 +39,30 @@ class TestSystemActions:
         assert result.data is not None
         assert "ip" in result.data
 
+    def test_get_ip_address_skips_down_and_virtual_adapters(self):
+        import socket
+        from kabolai.actions.system import get_ip_address
+
+        addr = lambda ip: MagicMock(family=socket.AF_INET, address=ip)
+        with patch("socket.socket.connect") as connect, \
+             patch("psutil.net_if_addrs", return_value={
+                 "Ethernet": [addr("10.0.0.5")],
+                 "vEthernet (WSL)": [addr("172.20.0.1")],
+                 "Loopback": [addr("127.0.0.1")],
+                 "Wi-Fi": [addr("192.168.1.20")],
+             }), \
+             patch("psutil.net_if_stats", return_value={
+                 "Ethernet": MagicMock(isup=False),
+                 "vEthernet (WSL)": MagicMock(isup=True),
+                 "Loopback": MagicMock(isup=True),
+                 "Wi-Fi": MagicMock(isup=True),
+             }):
+            result = get_ip_address()
+
+        connect.assert_not_called()
+
+        assert result.data["ip"] == "192.168.1.20"
+
 
 class TestWebActions:
     @patch("webbrowser.open")
@@ -75,7 +99,7 @@ class TestAppActions:
 
         result = open_app("notepad")
         assert result.success is True
-        mock_popen.assert_called_once()
+        mock_popen.assert_called_once_with(["notepad.exe"])
 
     @patch("subprocess.Popen")
     def test_open_app_unknown(self, mock_popen):
@@ -85,6 +109,14 @@ class TestAppActions:
         assert result.success is True
         mock_popen.assert_called()
 
+    @patch("subprocess.Popen")
+    def test_open_app_unique_prefix(self, mock_popen):
+        from kabolai.actions.apps import open_app
+
+        result = open_app("File Expl")
+        assert result.success is True
+        assert "explorer.exe" in str(mock_popen.call_args)
+
     @patch("subprocess.Popen", side_effect=FileNotFoundError("not found"))
     def test_open_app_failure(self, mock_popen):
         from kabolai.actions.apps import open_app
@@ -92,6 +124,73 @@ class TestAppActions:
         result = open_app("nonexistent_app_xyz")
         assert result.success is False
 
+    def test_process_snapshot_is_cached(self):
+        from kabolai.actions import apps
+
+        apps._invalidate_procs()
+        with patch("psutil.process_iter") as mock_iter:
+            proc = MagicMock(pid=42, info={"name": "Notepad.exe"})
+            mock_iter.return_value = [proc]
+            first = apps._get_procs()
+            second = apps._get_procs()
+
+        assert first == [(proc, "Notepad.exe", "notepad.exe")]
+        assert second is first
+        mock_iter.assert_called_once()
+        apps._invalidate_procs()
+
+    def test_close_app(self):
+        from kabolai.actions import apps
+
+        notepad, calc = MagicMock(), MagicMock()
+        with patch("kabolai.actions.apps._get_procs",
+                   return_value=[(notepad, "Notepad.exe", "notepad.exe"),
+                                 (calc, "calc.exe", "calc.exe")]):
+            result = apps.close_app("notepad")
+
+        assert result.success is True
+        notepad.terminate.assert_called_once()
+        calc.terminate.assert_not_called()
+
+    def test_close_app_prefers_exact_name(self):
+        from kabolai.actions import apps
+
+        code, helper = MagicMock(), MagicMock()
+        with patch("kabolai.actions.apps._get_procs",
+                   return_value=[(code, "Code.exe", "code.exe"),
+                                 (helper, "vscode-helper.exe", "vscode-helper.exe")]):
+            result = apps.close_app("code")
+
+        assert result.success is True
+        code.terminate.assert_called_once()
+        helper.terminate.assert_not_called()
+
+    def test_close_app_skips_reused_pid(self):
+        import psutil
+        from kabolai.actions import apps
+
+        stale = MagicMock()
+        # psutil raises this when the pid now belongs to a different process
+        stale.terminate.side_effect = psutil.NoSuchProcess(42)
+        with patch("kabolai.actions.apps._get_procs",
+                   return_value=[(stale, "Notepad.exe", "notepad.exe")]):
+            result = apps.close_app("notepad")
+
+        assert result.success is False
+
+    def test_list_running_apps(self):
+        from kabolai.actions import apps
+
+        with patch("kabolai.actions.apps._get_procs",
+                   return_value=[(1, "svchost.exe", "svchost.exe"),
+                                 (4, "conhost.exe", "conhost.exe"),
+                                 (2, "Code.exe", "code.exe"),
+                                 (3, "kworker", "kworker")]):
+            result = apps.list_running_apps()
+
+        assert result.success is True
+        assert result.data == ["Code"]
+
 
 class TestConversationActions:
     def test_list_commands(self):
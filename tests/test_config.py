@@ -1,5 +1,8 @@
 """Tests for configuration system."""
 
+import os
+from unittest.mock import patch
+
 import pytest
 from pathlib import Path
 
@@ -25,6 +28,14 @@ class TestDeepMerge:
         result = deep_merge(base, override)
         assert result == {"a": {"nested": True}}
 
+    def test_inputs_not_modified(self):
+        base = {"a": {"x": {"deep": 1}}, "b": {"y": 2}}
+        override = {"a": {"x": {"deep": 2}}}
+        result = deep_merge(base, override)
+        assert result == {"a": {"x": {"deep": 2}}, "b": {"y": 2}}
+        assert base == {"a": {"x": {"deep": 1}}, "b": {"y": 2}}
+        assert override == {"a": {"x": {"deep": 2}}}
+
     def test_empty_override(self):
         base = {"a": 1}
         result = deep_merge(base, {})
@@ -68,3 +79,47 @@ class TestAppConfig:
         assert cfg.audio.sample_rate == 22050
         assert cfg.hotkeys.quit == "ctrl+q"
         assert cfg.stt["engine"] == "whisper"
+
+    def test_load_with_user_config(self, tmp_path):
+        user = tmp_path / "user.yaml"
+        user.write_text("language: uk\naudio:\n  sample_rate: 22050\n", encoding="utf-8")
+
+        cfg = AppConfig.load(config_path=str(user))
+        assert cfg.language == "uk"
+        assert cfg.audio.sample_rate == 22050
+        assert cfg.audio.chunk_size == AudioConfig().chunk_size
+
+    def test_load_missing_user_config(self, tmp_path):
+        from kabolai.core.exceptions import ConfigError
+
+        with pytest.raises(ConfigError):
+            AppConfig.load(config_path=str(tmp_path / "missing.yaml"))
+
+
+class TestYamlCache:
+    def test_unchanged_file_is_parsed_once(self, tmp_path):
+        import yaml
+        from kabolai.core.config import _read_yaml
+
+        path = tmp_path / "c.yaml"
+        path.write_text("a:\n  b: 1\n", encoding="utf-8")
+
+        with patch.object(yaml, "load", wraps=yaml.load) as spy:
+            first = _read_yaml(path)
+            first["a"]["b"] = 99  # callers get their own copy
+            second = _read_yaml(path)
+
+        assert second == {"a": {"b": 1}}
+        assert spy.call_count == 1
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        from kabolai.core.config import _read_yaml
+
+        path = tmp_path / "c.yaml"
+        path.write_text("a: 1\n", encoding="utf-8")
+        assert _read_yaml(path) == {"a": 1}
+
+        path.write_text("a: 22\n", encoding="utf-8")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert _read_yaml(path) == {"a": 22}
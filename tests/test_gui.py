@@ -11,6 +11,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from kabolai.core.constants import Lang
 from kabolai.core.state import AssistantState
 from kabolai.gui.theme import (
     STATUS_TEXT, MIC_READY, MIC_LISTENING, MIC_PROCESSING,
@@ -79,6 +80,77 @@ class TestEventSystem:
             events2 = assistant.drain_events()
             assert len(events2) == 0
 
+    def test_status_events_are_coalesced(self):
+        """Only the latest status since the last drain should be queued,
+        in the position it was emitted."""
+        from kabolai.core.config import AppConfig
+
+        with patch("kabolai.assistant.create_stt_engine"), \
+             patch("kabolai.assistant.create_brain"), \
+             patch("kabolai.assistant.AudioRecorder"), \
+             patch("kabolai.assistant.AudioPlayer"):
+            from kabolai.assistant import Assistant
+            assistant = Assistant(AppConfig())
+
+            assistant._set_status("listening")
+            assistant._set_status("processing")
+            assistant._emit_event("user_text", {"text": "hi"})
+            assistant._set_status("ready")
+
+            events = assistant.drain_events()
+            assert [e["type"] for e in events] == ["user_text", "status"]
+            assert events[-1]["data"]["state"] == "ready"
+            assert assistant.drain_events() == []
+
+            assistant._set_status("processing")
+            assistant._emit_event("response_text", {"text": "ok"})
+            events = assistant.drain_events()
+            assert [e["type"] for e in events] == ["status", "response_text"]
+            assert events[0]["data"]["state"] == "processing"
+
+    def test_status_changes_reach_callbacks(self):
+        """Callbacks should receive every status change, uncoalesced."""
+        from kabolai.core.config import AppConfig
+
+        with patch("kabolai.assistant.create_stt_engine"), \
+             patch("kabolai.assistant.create_brain"), \
+             patch("kabolai.assistant.AudioRecorder"), \
+             patch("kabolai.assistant.AudioPlayer"):
+            from kabolai.assistant import Assistant
+            assistant = Assistant(AppConfig())
+
+            received = []
+            assistant.add_event_callback(
+                lambda etype, data: received.append((etype, data["state"]))
+            )
+            assistant._set_status("listening")
+            assistant._set_status("ready")
+
+            assert received == [("status", "listening"), ("status", "ready")]
+
+    def test_released_events_are_reused(self):
+        """Events handed back via release_events should be recycled."""
+        from kabolai.core.config import AppConfig
+
+        with patch("kabolai.assistant.create_stt_engine"), \
+             patch("kabolai.assistant.create_brain"), \
+             patch("kabolai.assistant.AudioRecorder"), \
+             patch("kabolai.assistant.AudioPlayer"):
+            from kabolai.assistant import Assistant
+            config = AppConfig()
+            assistant = Assistant(config)
+
+            assistant._emit_event("e1")
+            first = assistant.drain_events()
+            assert first[0]["data"] == {}
+            assistant.release_events(first)
+
+            assistant._emit_event("e2", {"n": 2})
+            second = assistant.drain_events()
+            assert second[0] is first[0]
+            assert second[0]["type"] == "e2"
+            assert second[0]["data"] == {"n": 2}
+
     def test_event_callback(self):
         """Registered callbacks should be called."""
         from kabolai.core.config import AppConfig
@@ -101,6 +173,273 @@ class TestEventSystem:
             assert received[0] == ("user_text", {"text": "hello"})
 
 
+class TestSTTCallingConvention:
+    """Test how the assistant calls STT engines."""
+
+    def test_language_passed_only_when_supported(self):
+        from kabolai.core.config import AppConfig
+        from kabolai.stt.base import TranscriptionResult
+
+        class LegacySTT:
+            def transcribe(self, audio_data, sample_rate=16000):
+                return TranscriptionResult(text="")
+
+        class LanguageSTT:
+            def transcribe(self, audio_data, sample_rate=16000, language=None):
+                self.language = language
+                return TranscriptionResult(text="")
+
+        with patch("kabolai.assistant.create_stt_engine"), \
+             patch("kabolai.assistant.create_brain"), \
+             patch("kabolai.assistant.AudioRecorder"), \
+             patch("kabolai.assistant.AudioPlayer"):
+            from kabolai.assistant import Assistant
+            assistant = Assistant(AppConfig(language="uk"))
+
+            assistant.stt = LegacySTT()
+            assert assistant._process(b"audio") is None
+
+            assistant.stt = LanguageSTT()
+            assert assistant._process(b"audio") is None
+            assert assistant.stt.language == "uk"
+
+
+class TestPipelineOverlap:
+    """Test overlapping of pipeline stages."""
+
+    def test_tts_loads_while_brain_runs(self):
+        """The TTS engine for the language should be requested before the brain returns."""
+        from kabolai.core.config import AppConfig
+        from kabolai.brain.models import BrainResponse
+        from kabolai.stt.base import TranscriptionResult
+
+        with patch("kabolai.assistant.create_stt_engine") as mock_stt, \
+             patch("kabolai.assistant.create_brain") as mock_brain, \
+             patch("kabolai.assistant.create_tts_engine") as mock_tts, \
+             patch("kabolai.assistant.AudioRecorder"), \
+             patch("kabolai.assistant.AudioPlayer"):
+            from kabolai.assistant import Assistant
+            config = AppConfig()
+            config.tts = {"preload": False}
+            assistant = Assistant(config)
+            assistant.tts_muted = True
+
+            mock_stt.return_value.transcribe.return_value = TranscriptionResult(text="hello")
+            seen = []
+
+            def think(text, lang):
+                assistant._tts_futures[Lang.EN].result()
+                seen.append(mock_tts.call_count)
+                return BrainResponse(response_text="hi", is_conversation=True)
+
+            mock_brain.return_value.process.side_effect = think
+            assert assistant._process(b"audio") == "hi"
+            assert seen == [1]
+            assert assistant.tts_en is mock_tts.return_value
+
+    def test_preload_both_warms_every_language(self):
+        """tts.preload_both should start a warm-up for each language."""
+        from kabolai.core.config import AppConfig
+
+        with patch("kabolai.assistant.create_stt_engine"), \
+             patch("kabolai.assistant.create_brain"), \
+             patch("kabolai.assistant.create_tts_engine") as mock_tts, \
+             patch("kabolai.assistant.AudioRecorder"), \
+             patch("kabolai.assistant.AudioPlayer"):
+            from kabolai.assistant import Assistant
+            config = AppConfig(language="uk")
+            config.tts = {"preload_both": True}
+            assistant = Assistant(config)
+
+            assert set(assistant._tts_futures) == {Lang.UK, Lang.EN}
+            assistant.tts_en
+            assistant.tts_uk
+            langs = sorted(c.kwargs["lang"] for c in mock_tts.call_args_list)
+            assert langs == ["en", "uk"]
+
+    def test_tts_settings_reach_pending_engine(self):
+        """Settings changed during warm-up should apply to the warmed engine."""
+        from concurrent.futures import Future
+        from kabolai.core.config import AppConfig
+
+        with patch("kabolai.assistant.create_stt_engine"), \
+             patch("kabolai.assistant.create_brain"), \
+             patch("kabolai.assistant.create_tts_engine"), \
+             patch("kabolai.assistant.AudioRecorder"), \
+             patch("kabolai.assistant.AudioPlayer"):
+            from kabolai.assistant import Assistant
+            config = AppConfig()
+            config.tts = {"preload": False}
+            assistant = Assistant(config)
+
+            pending = Future()
+            assistant._tts_futures[Lang.UK] = pending
+            assistant.configure_tts(Lang.UK, lambda tts: tts.set_voice("Lada"))
+
+            engine = MagicMock()
+            pending.set_result(engine)
+            assert assistant.tts_uk is engine
+            engine.set_voice.assert_called_once_with("Lada")
+
+            # Once loaded, changes apply immediately
+            assistant.configure_tts(Lang.UK, lambda tts: tts.set_voice("Mykyta"))
+            engine.set_voice.assert_called_with("Mykyta")
+
+    def test_concurrent_tts_loads_share_one_engine(self):
+        """Threads racing on first use should all get the same TTS engine."""
+        import threading
+        import time
+        from kabolai.core.config import AppConfig
+
+        def slow_engine(config, lang):
+            time.sleep(0.05)
+            return MagicMock()
+
+        with patch("kabolai.assistant.create_stt_engine"), \
+             patch("kabolai.assistant.create_brain"), \
+             patch("kabolai.assistant.create_tts_engine",
+                   side_effect=slow_engine) as mock_tts, \
+             patch("kabolai.assistant.AudioRecorder"), \
+             patch("kabolai.assistant.AudioPlayer"):
+            from kabolai.assistant import Assistant
+            config = AppConfig()
+            config.tts = {"preload": False}
+            assistant = Assistant(config)
+
+            engines = []
+            threads = [
+                threading.Thread(target=lambda: engines.append(assistant.tts_en))
+                for _ in range(4)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            assert mock_tts.call_count == 1
+            assert all(e is engines[0] for e in engines)
+
+    def test_silent_action_skips_response(self):
+        """An empty brain response should not be shown or spoken."""
+        from kabolai.core.config import AppConfig
+        from kabolai.brain.models import BrainResponse
+        from kabolai.stt.base import TranscriptionResult
+
+        with patch("kabolai.assistant.create_stt_engine") as mock_stt, \
+             patch("kabolai.assistant.create_brain") as mock_brain, \
+             patch("kabolai.assistant.create_tts_engine"), \
+             patch("kabolai.assistant.AudioRecorder"), \
+             patch("kabolai.assistant.AudioPlayer"):
+            from kabolai.assistant import Assistant
+            assistant = Assistant(AppConfig())
+
+            mock_stt.return_value.transcribe.return_value = TranscriptionResult(text="hello")
+            mock_brain.return_value.process.return_value = BrainResponse(
+                response_text="  ", is_conversation=True
+            )
+            assert assistant._process(b"audio") == "  "
+
+            types = [e["type"] for e in assistant.drain_events()]
+            assert "response_text" not in types
+            assistant.player.play_stream.assert_not_called()
+
+
+class TestSpeechStreaming:
+    """Test streamed TTS playback."""
+
+    def test_speak_streams_chunks_to_player(self):
+        """Chunks from synthesize_stream should reach the player in order."""
+        from kabolai.core.config import AppConfig
+        from kabolai.tts.base import SpeechResult
+
+        with patch("kabolai.assistant.create_stt_engine"), \
+             patch("kabolai.assistant.create_brain"), \
+             patch("kabolai.assistant.AudioRecorder") as mock_recorder, \
+             patch("kabolai.assistant.AudioPlayer"):
+            from kabolai.assistant import Assistant
+            assistant = Assistant(AppConfig())
+
+            chunks = [SpeechResult(audio_data=b"one"), SpeechResult(audio_data=b"two")]
+            tts = MagicMock()
+            tts.synthesize_stream.return_value = iter(chunks)
+            assistant._tts[Lang.EN] = tts
+
+            played = []
+            assistant.player.play_stream.side_effect = lambda it: played.extend(it)
+            assistant.speak("One. Two.", "en")
+
+            tts.synthesize_stream.assert_called_once_with("One. Two.")
+            assert played == chunks
+            assert assistant.state.is_speaking is False
+
+            # Speaking, interrupting and resetting never open the microphone
+            assistant.interrupt()
+            assistant.reset()
+            mock_recorder.assert_not_called()
+
+    def test_claiming_pipeline_clears_idle_flag(self):
+        """A claimed pipeline is never visible as idle to handle_voice waiters."""
+        from kabolai.core.config import AppConfig
+
+        with patch("kabolai.assistant.create_stt_engine"), \
+             patch("kabolai.assistant.create_brain"), \
+             patch("kabolai.assistant.AudioRecorder"), \
+             patch("kabolai.assistant.AudioPlayer"):
+            from kabolai.assistant import Assistant
+            assistant = Assistant(AppConfig())
+
+            assert assistant._claim_pipeline() is True
+            assert not assistant._pipeline_idle.is_set()
+            assert assistant._claim_pipeline() is False
+            assert not assistant._pipeline_idle.is_set()
+
+            assistant._release_pipeline()
+            assert assistant._pipeline_idle.is_set()
+            assert assistant.state.is_busy is False
+
+    def test_speech_handoff_keeps_only_newest_utterance(self):
+        """Utterances waiting for the worker are replaced, not queued up."""
+        from kabolai.assistant import _WORKER_STOP
+        from kabolai.core.config import AppConfig
+
+        with patch("kabolai.assistant.create_stt_engine"), \
+             patch("kabolai.assistant.create_brain"), \
+             patch("kabolai.assistant.AudioRecorder"), \
+             patch("kabolai.assistant.AudioPlayer"):
+            from kabolai.assistant import Assistant
+            assistant = Assistant(AppConfig())
+
+            assistant._hand_off("first")
+            assistant._hand_off("second")
+            assert assistant._speech_q.qsize() == 1
+            assert assistant._speech_q.get_nowait() == "second"
+
+            # A pending stop request is never displaced by new speech
+            assistant._hand_off(_WORKER_STOP)
+            assistant._hand_off("late")
+            assert assistant._speech_q.get_nowait() is _WORKER_STOP
+
+    def test_empty_speech_skips_speaking_state(self):
+        """Blank text should never reach TTS or flip the speaking state."""
+        from kabolai.core.config import AppConfig
+
+        with patch("kabolai.assistant.create_stt_engine"), \
+             patch("kabolai.assistant.create_brain"), \
+             patch("kabolai.assistant.AudioRecorder"), \
+             patch("kabolai.assistant.AudioPlayer"):
+            from kabolai.assistant import Assistant
+            assistant = Assistant(AppConfig())
+            tts = MagicMock()
+            assistant._tts[Lang.EN] = tts
+            assistant.drain_events()
+
+            assistant.speak("   ", "en")
+
+            tts.synthesize_stream.assert_not_called()
+            assistant.player.play_stream.assert_not_called()
+            assert assistant.drain_events() == []
+
+
 class TestSelfHealing:
     """Test the self-healing pipeline mechanism."""
 
@@ -110,7 +449,7 @@ class TestSelfHealing:
         # Simulate a stuck pipeline
         assert state.try_start_pipeline() is True
         # Manually set start time to the past
-        state._pipeline_start = time.monotonic() - 120  # 2 minutes ago
+        state._pipeline_start = time.monotonic_ns() - 120 * 10**9  # 2 minutes ago
 
         # This should trigger self-healing and allow new pipeline
         assert state.try_start_pipeline() is True
@@ -9,6 +9,17 @@ from kabolai.brain.ollama_brain import OllamaBrain
 from kabolai.brain.models import BrainResponse
 
 
+def _stream_lines(content: str, pieces: int = 3) -> list:
+    """Encode content as Ollama's streamed /api/chat lines."""
+    step = max(1, len(content) // pieces)
+    lines = [
+        json.dumps({"message": {"content": content[i:i + step]}, "done": False}).encode()
+        for i in range(0, len(content), step)
+    ]
+    lines.append(json.dumps({"message": {"content": ""}, "done": True}).encode())
+    return lines
+
+
 @pytest.fixture
 def brain():
     return OllamaBrain(
@@ -20,7 +31,7 @@ def brain():
 
 
 class TestOllamaBrain:
-    @patch("kabolai.brain.ollama_brain.requests.post")
+    @patch("kabolai.brain.ollama_brain.requests.Session.post")
     def test_process_command(self, mock_post, brain):
         """Test parsing a command from LLM response."""
         # Import actions to populate registry
@@ -29,19 +40,15 @@ class TestOllamaBrain:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "message": {
-                "content": json.dumps({
-                    "command": {
-                        "action": "open_app",
-                        "params": {"app_name": "notepad"},
-                        "confidence": 0.95,
-                    },
-                    "response_text": "Opening notepad",
-                    "is_conversation": False,
-                })
-            }
-        }
+        mock_response.iter_lines.return_value = _stream_lines(json.dumps({
+            "command": {
+                "action": "open_app",
+                "params": {"app_name": "notepad"},
+                "confidence": 0.95,
+            },
+            "response_text": "Opening notepad",
+            "is_conversation": False,
+        }))
         mock_post.return_value = mock_response
 
         result = brain.process("open notepad", "en")
@@ -50,27 +57,80 @@ class TestOllamaBrain:
         assert result.command.action == "open_app"
         assert result.command.params["app_name"] == "notepad"
 
-    @patch("kabolai.brain.ollama_brain.requests.post")
+    @patch("kabolai.brain.ollama_brain.requests.Session.post")
     def test_process_conversation(self, mock_post, brain):
         """Test parsing a conversational response."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "message": {
-                "content": json.dumps({
-                    "command": None,
-                    "response_text": "I'm doing great!",
-                    "is_conversation": True,
-                })
-            }
-        }
+        mock_response.iter_lines.return_value = _stream_lines(json.dumps({
+            "command": None,
+            "response_text": "I'm doing great!",
+            "is_conversation": True,
+        }))
         mock_post.return_value = mock_response
 
         result = brain.process("how are you?", "en")
         assert result.is_conversation is True
         assert result.command is None
 
-    @patch("kabolai.brain.ollama_brain.requests.post")
+    @patch("kabolai.brain.ollama_brain.requests.Session.post")
+    def test_process_stops_after_json_object(self, mock_post, brain):
+        """Reading stops at the reply's closing brace and the response is closed,
+        so a long tail after a valid reply is neither read nor counted."""
+        content = json.dumps({
+            "command": None,
+            "response_text": "Braces {in} text \\\"quoted\\\"",
+            "is_conversation": True,
+        })
+        lines = _stream_lines(content, pieces=5)
+        lines[-1:-1] = [
+            json.dumps({"message": {"content": "\n" * 20000}, "done": False}).encode()
+        ] * 3
+        consumed = []
+
+        def iter_lines():
+            for line in lines:
+                consumed.append(line)
+                yield line
+
+        mock_response = MagicMock()
+        mock_response.iter_lines.side_effect = iter_lines
+        mock_post.return_value = mock_response
+
+        result = brain.process("hi", "en")
+        assert result.response_text == json.loads(content)["response_text"]
+        assert consumed == lines[:-4]
+        mock_response.close.assert_called_once()
+
+    @patch("kabolai.brain.ollama_brain.requests.Session.post")
+    def test_process_keeps_system_prefix_and_trims_history(self, mock_post, brain):
+        from kabolai.brain.ollama_brain import MAX_HISTORY_MESSAGES
+
+        def respond(*args, **kwargs):
+            mock_response = MagicMock()
+            mock_response.iter_lines.return_value = _stream_lines(json.dumps({
+                "command": None,
+                "response_text": "ok",
+                "is_conversation": True,
+            }))
+            return mock_response
+
+        mock_post.side_effect = respond
+        history = [
+            {"role": "user" if i % 2 == 0 else "assistant", "content": f"turn {i}"}
+            for i in range(MAX_HISTORY_MESSAGES + 6)
+        ]
+
+        brain.process("first", "en")
+        brain.process("second", "en", conversation_history=history)
+
+        first, second = (json.loads(c.kwargs["data"])["messages"]
+                         for c in mock_post.call_args_list)
+        assert second[0] == first[0]
+        assert second[1:-1] == history[-MAX_HISTORY_MESSAGES:]
+        assert second[-1] == {"role": "user", "content": "second"}
+
+    @patch("kabolai.brain.ollama_brain.requests.Session.post")
     def test_process_connection_error(self, mock_post, brain):
         """Test handling when Ollama is not reachable."""
         import requests as req
@@ -80,7 +140,7 @@ class TestOllamaBrain:
         assert result.is_conversation is True
         assert "Ollama" in result.response_text
 
-    @patch("kabolai.brain.ollama_brain.requests.post")
+    @patch("kabolai.brain.ollama_brain.requests.Session.post")
     def test_process_timeout(self, mock_post, brain):
         """Test handling request timeout."""
         import requests as req
@@ -90,21 +150,19 @@ class TestOllamaBrain:
         assert result.is_conversation is True
         assert "timeout" in result.response_text.lower() or "timed out" in result.response_text.lower()
 
-    @patch("kabolai.brain.ollama_brain.requests.post")
+    @patch("kabolai.brain.ollama_brain.requests.Session.post")
     def test_process_invalid_json(self, mock_post, brain):
         """Test handling malformed JSON from LLM."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "message": {"content": "not valid json at all"}
-        }
+        mock_response.iter_lines.return_value = _stream_lines("not valid json at all")
         mock_post.return_value = mock_response
 
         result = brain.process("hello", "en")
         assert result.is_conversation is True
         assert "trouble" in result.response_text.lower() or "sorry" in result.response_text.lower()
 
-    @patch("kabolai.brain.ollama_brain.requests.get")
+    @patch("kabolai.brain.ollama_brain.requests.Session.get")
     def test_is_available_true(self, mock_get, brain):
         """Test availability check when Ollama is running."""
         mock_response = MagicMock()
@@ -116,7 +174,7 @@ class TestOllamaBrain:
 
         assert brain.is_available() is True
 
-    @patch("kabolai.brain.ollama_brain.requests.get")
+    @patch("kabolai.brain.ollama_brain.requests.Session.get")
     def test_is_available_false(self, mock_get, brain):
         """Test availability check when Ollama is down."""
         import requests as req
@@ -124,24 +182,20 @@ class TestOllamaBrain:
 
         assert brain.is_available() is False
 
-    @patch("kabolai.brain.ollama_brain.requests.post")
+    @patch("kabolai.brain.ollama_brain.requests.Session.post")
     def test_process_ukrainian(self, mock_post, brain):
         """Test processing Ukrainian input."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "message": {
-                "content": json.dumps({
-                    "command": {
-                        "action": "get_time",
-                        "params": {},
-                        "confidence": 0.99,
-                    },
-                    "response_text": "Зараз перевірю",
-                    "is_conversation": False,
-                })
-            }
-        }
+        mock_response.iter_lines.return_value = _stream_lines(json.dumps({
+            "command": {
+                "action": "get_time",
+                "params": {},
+                "confidence": 0.99,
+            },
+            "response_text": "Зараз перевірю",
+            "is_conversation": False,
+        }))
         mock_post.return_value = mock_response
 
         result = brain.process("Котра година?", "uk")
@@ -113,3 +113,25 @@ class TestAssistantState:
         assert state.is_listening is False
         assert state.is_processing is False
         assert state.is_speaking is False
+
+    def test_renew_pipeline_keeps_lock(self):
+        state = AssistantState()
+        assert state.try_start_pipeline() is True
+        state.set_speaking(True)
+        state.renew_pipeline()
+        assert state.is_busy is False
+        assert state._pipeline_start > 0
+        # Still held by the current owner
+        assert state.try_start_pipeline() is False
+        state.end_pipeline()
+
+    def test_wait_for_shutdown(self):
+        state = AssistantState()
+        assert state.wait_for_shutdown(0.01) is False
+        threading.Timer(0.01, state.shutdown).start()
+        assert state.wait_for_shutdown(5) is True
+        assert state.is_running is False
+
+    def test_no_instance_dict(self):
+        state = AssistantState()
+        assert not hasattr(state, "__dict__")